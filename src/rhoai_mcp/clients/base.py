@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Generator
+import threading
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from kubernetes import client, config  # type: ignore[import-untyped]
 from kubernetes.client import ApiException  # type: ignore[import-untyped]
@@ -19,6 +20,14 @@ from rhoai_mcp.utils.errors import AuthenticationError, NotFoundError, RHOAIErro
 logger = logging.getLogger(__name__)
 
 
+class ResourcePage(NamedTuple):
+    """One page of a chunked list request."""
+
+    items: list[Any]
+    continue_token: str | None
+    remaining_item_count: int | None
+
+
 class CRDDefinition:
     """Definition of a Custom Resource."""
 
@@ -96,6 +105,12 @@ class K8sClient:
         self._dynamic_client: DynamicClient | None = None
         self._core_v1: client.CoreV1Api | None = None
         self._crd_cache: dict[str, Resource] = {}
+        # Serializes discovery so concurrent first lookups do not repeat it
+        self._crd_cache_lock = threading.Lock()
+        # (monotonic timestamp, name) of the last auto-detected RWX storage class
+        self._rwx_sc_cache: tuple[float, str | None] | None = None
+        # volumeBindingMode per storage class name; storage classes are immutable
+        self._sc_binding_modes: dict[str, str | None] = {}
 
     def connect(self) -> None:
         """Establish connection to Kubernetes API."""
@@ -115,6 +130,8 @@ class K8sClient:
             self._dynamic_client = None
             self._core_v1 = None
             self._crd_cache.clear()
+            self._rwx_sc_cache = None
+            self._sc_binding_modes.clear()
             logger.info("Disconnected from Kubernetes API")
 
     @property
@@ -133,6 +150,16 @@ class K8sClient:
         else:  # AUTO
             return self._create_auto_client()
 
+    def _new_configuration(self) -> client.Configuration:
+        """Create a client configuration with the configured connection pool size.
+
+        urllib3 defaults to a handful of pooled connections, so concurrent tool
+        calls would otherwise queue for a socket to the API server.
+        """
+        configuration = client.Configuration()
+        configuration.connection_pool_maxsize = self._config.k8s_connection_pool_maxsize
+        return configuration
+
     def _create_token_client(self) -> client.ApiClient:
         """Create client using explicit token authentication."""
         if not self._config.api_server or not self._config.api_token:
@@ -140,7 +167,7 @@ class K8sClient:
                 "api_server and api_token are required for token authentication"
             )
 
-        configuration = client.Configuration()
+        configuration = self._new_configuration()
         configuration.host = self._config.api_server
         configuration.api_key = {"authorization": f"Bearer {self._config.api_token}"}
         configuration.verify_ssl = True
@@ -158,6 +185,7 @@ class K8sClient:
         return config.new_client_from_config(
             config_file=str(kubeconfig_path),
             context=self._config.kubeconfig_context,
+            client_configuration=self._new_configuration(),
         )
 
     def _create_auto_client(self) -> client.ApiClient:
@@ -170,6 +198,7 @@ class K8sClient:
             # After load_incluster_config, we need to create client with the loaded config
             # The incluster config sets the default, so we create Configuration from it
             configuration = client.Configuration.get_default_copy()
+            configuration.connection_pool_maxsize = self._config.k8s_connection_pool_maxsize
             return client.ApiClient(configuration)
 
         # Fall back to kubeconfig
@@ -180,6 +209,7 @@ class K8sClient:
             return config.new_client_from_config(
                 config_file=str(kubeconfig_path),
                 context=self._config.kubeconfig_context,
+                client_configuration=self._new_configuration(),
             )
 
         raise AuthenticationError(
@@ -207,7 +237,15 @@ class K8sClient:
         Uses caching to avoid repeated API discovery calls.
         """
         cache_key = f"{crd.api_version}/{crd.plural}"
-        if cache_key not in self._crd_cache:
+        cached = self._crd_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        with self._crd_cache_lock:
+            # Another thread may have discovered it while we waited
+            if cache_key in self._crd_cache:
+                return self._crd_cache[cache_key]
+
             # Use search() with kind and name filters for precise lookups.
             # Using kind alone with get() can match multiple resources
             # (e.g., OpenShift's template.openshift.io/v1 has both 'templates'
@@ -226,7 +264,7 @@ class K8sClient:
             if not results:
                 raise RHOAIError(f"Resource not found: {crd.api_version}/{crd.kind}")
             self._crd_cache[cache_key] = results[0]
-        return self._crd_cache[cache_key]
+            return results[0]
 
     def get(
         self,
@@ -268,6 +306,85 @@ class K8sClient:
         except ApiException as e:
             raise RHOAIError(f"Failed to list {crd.kind}: {e.reason}")
 
+    def list_resources_page(
+        self,
+        crd: CRDDefinition,
+        limit: int,
+        namespace: str | None = None,
+        continue_token: str | None = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+    ) -> ResourcePage:
+        """List one page of resources using the API server's limit/continue chunking.
+
+        Args:
+            crd: Resource definition to list.
+            limit: Maximum number of items the API server should return.
+            namespace: Optional namespace to list in.
+            continue_token: Token from a previous page's continue_token.
+            label_selector: Optional label selector applied by the API server.
+            field_selector: Optional field selector applied by the API server.
+
+        Returns:
+            The page of items, the token for the next page (None on the last
+            page) and the API server's remaining item estimate, if provided.
+        """
+        resource = self.get_resource(crd)
+        try:
+            kwargs: dict[str, Any] = {"limit": limit}
+            if namespace:
+                kwargs["namespace"] = namespace
+            if continue_token:
+                kwargs["_continue"] = continue_token
+            if label_selector:
+                kwargs["label_selector"] = label_selector
+            if field_selector:
+                kwargs["field_selector"] = field_selector
+
+            result = resource.get(**kwargs)
+        except ApiException as e:
+            if e.status == 410:
+                raise RHOAIError(
+                    f"Continue token for {crd.kind} list has expired; restart from the first page"
+                )
+            raise RHOAIError(f"Failed to list {crd.kind}: {e.reason}")
+
+        metadata = result.metadata
+        return ResourcePage(
+            items=list(result.items),
+            continue_token=getattr(metadata, "continue", None) or None,
+            remaining_item_count=getattr(metadata, "remainingItemCount", None),
+        )
+
+    def iter_resources(
+        self,
+        crd: CRDDefinition,
+        namespace: str | None = None,
+        chunk_size: int = 500,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        continue_token: str | None = None,
+    ) -> Iterator[Any]:
+        """Iterate over resources, fetching them from the API server in chunks.
+
+        Only one chunk of raw objects is held at a time, so callers that
+        convert items as they go avoid keeping the whole list in memory twice.
+        Pass continue_token to resume after a page the caller already fetched.
+        """
+        while True:
+            page = self.list_resources_page(
+                crd,
+                limit=chunk_size,
+                namespace=namespace,
+                continue_token=continue_token,
+                label_selector=label_selector,
+                field_selector=field_selector,
+            )
+            yield from page.items
+            continue_token = page.continue_token
+            if not continue_token:
+                return
+
     def create(
         self,
         crd: CRDDefinition,
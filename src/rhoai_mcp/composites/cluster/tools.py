@@ -411,19 +411,17 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         resource_type = resource_type.lower()
 
         if resource_type in ("workbench", "notebook"):
-            from rhoai_mcp.domains.notebooks.client import NotebookClient
             from rhoai_mcp.utils.response import ResponseBuilder, Verbosity
 
-            nb_client = NotebookClient(server.k8s)
+            nb_client = server.notebook_client
             wb = nb_client.get_workbench(name, namespace)
             v = Verbosity.from_str(verbosity)
             return ResponseBuilder.workbench_detail(wb, v)
 
         if resource_type in ("model", "inference", "inferenceservice"):
-            from rhoai_mcp.domains.inference.client import InferenceClient
             from rhoai_mcp.utils.response import ResponseBuilder, Verbosity
 
-            inf_client = InferenceClient(server.k8s)
+            inf_client = server.inference_client
             isvc = inf_client.get_inference_service(name, namespace)
             v = Verbosity.from_str(verbosity)
             return ResponseBuilder.inference_service_detail(isvc, v)
@@ -438,9 +436,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
             return ResponseBuilder.training_job_detail(job, v)
 
         if resource_type in ("connection", "data_connection"):
-            from rhoai_mcp.domains.connections.client import ConnectionClient
-
-            conn_client = ConnectionClient(server.k8s)
+            conn_client = server.connection_client
             conn = conn_client.get_data_connection(name, namespace, mask_secrets=True)
             return dict(conn.model_dump())
 
@@ -562,8 +558,6 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
 
 def _diagnose_workbench(server: "RHOAIServer", name: str, namespace: str) -> dict:
     """Diagnose a workbench."""
-    from rhoai_mcp.domains.notebooks.client import NotebookClient
-
     result: dict = {
         "resource": None,
         "status_summary": "Unknown",
@@ -575,7 +569,7 @@ def _diagnose_workbench(server: "RHOAIServer", name: str, namespace: str) -> dic
     }
 
     try:
-        client = NotebookClient(server.k8s)
+        client = server.notebook_client
         wb = client.get_workbench(name, namespace)
         result["resource"] = {
             "name": wb.metadata.name,
@@ -671,8 +665,6 @@ def _diagnose_workbench(server: "RHOAIServer", name: str, namespace: str) -> dic
 
 def _diagnose_model(server: "RHOAIServer", name: str, namespace: str) -> dict:
     """Diagnose a model deployment."""
-    from rhoai_mcp.domains.inference.client import InferenceClient
-
     result: dict = {
         "resource": None,
         "status_summary": "Unknown",
@@ -684,7 +676,7 @@ def _diagnose_model(server: "RHOAIServer", name: str, namespace: str) -> dict:
     }
 
     try:
-        client = InferenceClient(server.k8s)
+        client = server.inference_client
         isvc = client.get_inference_service(name, namespace)
         result["resource"] = {
             "name": isvc.metadata.name,
@@ -861,9 +853,7 @@ def _diagnose_pipeline(
 
 def _manage_workbench(server: "RHOAIServer", action: str, name: str, namespace: str) -> dict:
     """Manage workbench lifecycle."""
-    from rhoai_mcp.domains.notebooks.client import NotebookClient
-
-    client = NotebookClient(server.k8s)
+    client = server.notebook_client
 
     if action == "start":
         wb = client.start_workbench(name, namespace)
@@ -880,9 +870,7 @@ def _manage_workbench(server: "RHOAIServer", action: str, name: str, namespace:
 
 def _manage_model(server: "RHOAIServer", action: str, name: str, namespace: str) -> dict:
     """Manage model lifecycle."""
-    from rhoai_mcp.domains.inference.client import InferenceClient
-
-    client = InferenceClient(server.k8s)
+    client = server.inference_client
 
     if action == "delete":
         client.delete_inference_service(name, namespace)
@@ -920,9 +908,7 @@ def _get_resource_status(
     resource_type = resource_type.lower()
 
     if resource_type in ("workbench", "notebook"):
-        from rhoai_mcp.domains.notebooks.client import NotebookClient
-
-        notebook_client = NotebookClient(server.k8s)
+        notebook_client = server.notebook_client
         wb = notebook_client.get_workbench(name, namespace)
         return ResourceStatus(
             name=wb.metadata.name,
@@ -932,9 +918,7 @@ def _get_resource_status(
         )
 
     if resource_type in ("model", "inferenceservice", "inference"):
-        from rhoai_mcp.domains.inference.client import InferenceClient
-
-        inference_client = InferenceClient(server.k8s)
+        inference_client = server.inference_client
         isvc = inference_client.get_inference_service(name, namespace)
         return ResourceStatus(
             name=isvc.metadata.name,
@@ -981,9 +965,7 @@ def _get_resource_status(
         )
 
     if resource_type in ("connection", "data_connection", "secret"):
-        from rhoai_mcp.domains.connections.client import ConnectionClient
-
-        connection_client = ConnectionClient(server.k8s)
+        connection_client = server.connection_client
         conn = connection_client.get_data_connection(name, namespace, mask_secrets=True)
         return ResourceStatus(
             name=conn.metadata.name,
@@ -1065,9 +1047,7 @@ def _list_resource_names(
         )
 
     if resource_type in ("workbench", "workbenches", "notebook", "notebooks"):
-        from rhoai_mcp.domains.notebooks.client import NotebookClient
-
-        notebook_client = NotebookClient(server.k8s)
+        notebook_client = server.notebook_client
         workbenches = notebook_client.list_workbenches(namespace)
         return ResourceNameList(
             type="workbenches",
@@ -1077,9 +1057,7 @@ def _list_resource_names(
         )
 
     if resource_type in ("model", "models", "inferenceservice", "inferenceservices"):
-        from rhoai_mcp.domains.inference.client import InferenceClient
-
-        inference_client = InferenceClient(server.k8s)
+        inference_client = server.inference_client
         models = inference_client.list_inference_services(namespace)
         return ResourceNameList(
             type="models",
@@ -1101,9 +1079,7 @@ def _list_resource_names(
         )
 
     if resource_type in ("connection", "connections", "data_connection", "data_connections"):
-        from rhoai_mcp.domains.connections.client import ConnectionClient
-
-        connection_client = ConnectionClient(server.k8s)
+        connection_client = server.connection_client
         connections = connection_client.list_data_connections(namespace)
         return ResourceNameList(
             type="connections",
@@ -1,5 +1,6 @@
 """MCP Tools for tool discovery and workflow guidance."""
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp import FastMCP
@@ -85,6 +86,24 @@ TOOL_CATEGORIES: dict[str, dict[str, Any]] = {
     },
 }
 
+# Category names returned with every suggest_tools response
+_ALL_CATEGORIES: tuple[str, ...] = tuple(TOOL_CATEGORIES)
+
+# list_tool_categories response, derived once from the static TOOL_CATEGORIES
+_TOOL_CATEGORIES_SUMMARY: dict[str, Any] = {
+    "categories": [
+        {
+            "category": name,
+            "description": info["description"],
+            "key_tools": info["tools"][:3],
+            "use_first": info.get("use_first", False),
+        }
+        for name, info in TOOL_CATEGORIES.items()
+    ],
+    "recommendation": "Start with 'discovery' tools like explore_cluster() "
+    "to understand the cluster state before taking actions.",
+}
+
 
 # Intent patterns for suggest_tools
 INTENT_PATTERNS = [
@@ -135,6 +154,101 @@ INTENT_PATTERNS = [
 DISCOVERY_PATTERN = next(p for p in INTENT_PATTERNS if p["category"] == "discovery")
 
 
+def _keyword_forms(keyword: str) -> tuple[str, ...]:
+    """Return the substrings that count as a hit for an intent keyword.
+
+    Substring matching already catches most inflections ("train" in
+    "training"), but not the -ing form of keywords ending in "e"
+    ("serve" -> "serving"), so those get an extra form.
+    """
+    if keyword.endswith("e"):
+        return (keyword, keyword[:-1] + "ing")
+    return (keyword,)
+
+
+def _build_keyword_index() -> tuple[tuple[tuple[str, ...], tuple[int, ...]], ...]:
+    """Map each distinct intent keyword to the patterns that list it.
+
+    Each keyword is then matched once per intent, however many patterns share it.
+    """
+    owners: dict[str, list[int]] = {}
+    for index, pattern in enumerate(INTENT_PATTERNS):
+        for keyword in pattern["patterns"]:
+            owners.setdefault(keyword, []).append(index)
+    return tuple((_keyword_forms(keyword), tuple(indices)) for keyword, indices in owners.items())
+
+
+# Match forms of every distinct intent keyword with the indices of its
+# owning patterns, built once so scoring is a single pass per call
+_INTENT_KEYWORDS = _build_keyword_index()
+
+
+def _score_intent(intent: str) -> list[int]:
+    """Count keyword hits for every intent pattern, in INTENT_PATTERNS order."""
+    intent_lower = intent.lower()
+    scores = [0] * len(INTENT_PATTERNS)
+    for forms, owners in _INTENT_KEYWORDS:
+        if any(form in intent_lower for form in forms):
+            for index in owners:
+                scores[index] += 1
+    return scores
+
+
+def _match_intent(intent: str) -> dict[str, Any]:
+    """Return the intent pattern with the most keyword hits.
+
+    Ties go to the pattern defined first; no hits falls back to discovery.
+    """
+    scores = _score_intent(intent)
+    best_score = max(scores)
+    if not best_score:
+        return DISCOVERY_PATTERN
+    return INTENT_PATTERNS[scores.index(best_score)]
+
+
+# Example arguments for suggest_tools workflows, keyed by tool name. Each
+# builder takes (namespace, resource_name); unlisted tools get a namespace only.
+_EXAMPLE_ARGS: dict[str, Callable[[str, str], dict[str, Any]]] = {
+    "prepare_training": lambda namespace, _: {
+        "namespace": namespace,
+        "model_id": "meta-llama/Llama-2-7b-hf",
+        "dataset_id": "tatsu-lab/alpaca",
+    },
+    "train": lambda namespace, _: {
+        "namespace": namespace,
+        "model_id": "meta-llama/Llama-2-7b-hf",
+        "dataset_id": "tatsu-lab/alpaca",
+        "runtime_name": "mcp-transformers-runtime",
+        "confirmed": True,
+    },
+    "prepare_model_deployment": lambda namespace, _: {
+        "namespace": namespace,
+        "model_id": "meta-llama/Llama-2-7b-hf",
+    },
+    "deploy_model": lambda namespace, _: {
+        "namespace": namespace,
+        "name": "my-model",
+        "runtime": "vllm-runtime",
+        "model_format": "pytorch",
+        "storage_uri": "pvc://model-storage/model",
+    },
+    "diagnose_resource": lambda namespace, resource_name: {
+        "resource_type": "training_job",
+        "name": resource_name,
+        "namespace": namespace,
+    },
+    "explore_cluster": lambda _namespace, _: {},
+}
+
+
+def _example_args(tool: str, namespace: str, resource_name: str) -> dict[str, Any]:
+    """Build example arguments for a tool in a suggested workflow."""
+    builder = _EXAMPLE_ARGS.get(tool)
+    if builder is None:
+        return {"namespace": namespace}
+    return builder(namespace, resource_name)
+
+
 def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:  # noqa: ARG001
     """Register meta tools with the MCP server."""
 
@@ -165,101 +279,15 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:  # noqa: ARG001
             - "deploy a model for inference"
             - "see what's running in my cluster"
         """
-        intent_lower = intent.lower()
         context = context or {}
+        best_match = _match_intent(intent)
 
-        # Find matching pattern
-        best_match = None
-        match_score = 0
-
-        for pattern in INTENT_PATTERNS:
-            score = sum(1 for p in pattern["patterns"] if p in intent_lower)
-            if score > match_score:
-                match_score = score
-                best_match = pattern
-
-        if not best_match:
-            # Default to discovery
-            best_match = DISCOVERY_PATTERN
-
-        # Build example calls
-        example_calls = []
         namespace = context.get("namespace", "my-project")
         resource_name = context.get("resource_name", "my-resource")
-
-        for tool in best_match["workflow"]:
-            if tool == "prepare_training":
-                example_calls.append(
-                    {
-                        "tool": tool,
-                        "args": {
-                            "namespace": namespace,
-                            "model_id": "meta-llama/Llama-2-7b-hf",
-                            "dataset_id": "tatsu-lab/alpaca",
-                        },
-                    }
-                )
-            elif tool == "train":
-                example_calls.append(
-                    {
-                        "tool": tool,
-                        "args": {
-                            "namespace": namespace,
-                            "model_id": "meta-llama/Llama-2-7b-hf",
-                            "dataset_id": "tatsu-lab/alpaca",
-                            "runtime_name": "mcp-transformers-runtime",
-                            "confirmed": True,
-                        },
-                    }
-                )
-            elif tool == "prepare_model_deployment":
-                example_calls.append(
-                    {
-                        "tool": tool,
-                        "args": {
-                            "namespace": namespace,
-                            "model_id": "meta-llama/Llama-2-7b-hf",
-                        },
-                    }
-                )
-            elif tool == "deploy_model":
-                example_calls.append(
-                    {
-                        "tool": tool,
-                        "args": {
-                            "namespace": namespace,
-                            "name": "my-model",
-                            "runtime": "vllm-runtime",
-                            "model_format": "pytorch",
-                            "storage_uri": "pvc://model-storage/model",
-                        },
-                    }
-                )
-            elif tool == "diagnose_resource":
-                example_calls.append(
-                    {
-                        "tool": tool,
-                        "args": {
-                            "resource_type": "training_job",
-                            "name": resource_name,
-                            "namespace": namespace,
-                        },
-                    }
-                )
-            elif tool == "explore_cluster":
-                example_calls.append(
-                    {
-                        "tool": tool,
-                        "args": {},
-                    }
-                )
-            else:
-                example_calls.append(
-                    {
-                        "tool": tool,
-                        "args": {"namespace": namespace},
-                    }
-                )
+        example_calls = [
+            {"tool": tool, "args": _example_args(tool, namespace, resource_name)}
+            for tool in best_match["workflow"]
+        ]
 
         return {
             "intent": intent,
@@ -267,7 +295,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:  # noqa: ARG001
             "workflow": best_match["workflow"],
             "explanation": best_match["explanation"],
             "example_calls": example_calls,
-            "all_categories": list(TOOL_CATEGORIES.keys()),
+            "all_categories": list(_ALL_CATEGORIES),
         }
 
     @mcp.tool()
@@ -280,19 +308,11 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:  # noqa: ARG001
         Returns:
             Tool categories with descriptions and key tools.
         """
-        categories = []
-        for name, info in TOOL_CATEGORIES.items():
-            categories.append(
-                {
-                    "category": name,
-                    "description": info["description"],
-                    "key_tools": info["tools"][:3],
-                    "use_first": info.get("use_first", False),
-                }
-            )
-
+        # Copy so callers cannot mutate the shared precomputed response
         return {
-            "categories": categories,
-            "recommendation": "Start with 'discovery' tools like explore_cluster() "
-            "to understand the cluster state before taking actions.",
+            "categories": [
+                {**category, "key_tools": list(category["key_tools"])}
+                for category in _TOOL_CATEGORIES_SUMMARY["categories"]
+            ],
+            "recommendation": _TOOL_CATEGORIES_SUMMARY["recommendation"],
         }
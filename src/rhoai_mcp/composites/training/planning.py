@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import hashlib
 import re
+import string
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp import FastMCP
@@ -19,6 +23,38 @@ from rhoai_mcp.utils.errors import NotFoundError
 if TYPE_CHECKING:
     from rhoai_mcp.server import RHOAIServer
 
+# Fine-tuning methods accepted by prepare_training
+_VALID_METHODS = frozenset(m.value for m in PeftMethod)
+
+# HuggingFace-style "organization/name" identifiers
+_HF_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9._-]+$")
+
+
+class _PvcNameTable(dict[int, int]):
+    """str.translate table keeping [a-z0-9-] and mapping any other character to '-'."""
+
+    def __missing__(self, codepoint: int) -> int:
+        return ord("-")
+
+
+# PVC name sanitization
+_PVC_TRANSLATION = _PvcNameTable(
+    {ord(c): ord(c) for c in string.ascii_lowercase + string.digits + "-"}
+)
+_PVC_REPEATED_HYPHENS = re.compile(r"-+")
+
+# Parameter counts in model IDs: billions (7b, 70b, 7.1b) take precedence
+# over millions (350m) anywhere in the ID
+_BILLION_PARAMS_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*b(?:illion)?")
+_MILLION_PARAMS_PATTERN = re.compile(r"(\d+)m")
+
+# GPU_MEMORY_ESTIMATES buckets sorted by lower bound, for bisect lookups
+_MEMORY_BUCKETS = sorted(GPU_MEMORY_ESTIMATES.items())
+_MEMORY_BUCKET_STARTS = [min_p for (min_p, _), _ in _MEMORY_BUCKETS]
+
+# Base GPU memory assumed for models outside every estimate bucket
+_DEFAULT_BASE_MEMORY_GB = 16
+
 
 def register_tools(mcp: FastMCP, server: RHOAIServer) -> None:
     """Register training planning tools with the MCP server."""
@@ -52,12 +88,7 @@ def register_tools(mcp: FastMCP, server: RHOAIServer) -> None:
         # Parse model size from name
         param_count = _extract_param_count(model_id)
 
-        # Get base memory estimate
-        base_memory = 16  # Default for unknown models
-        for (min_p, max_p), mem in GPU_MEMORY_ESTIMATES.items():
-            if min_p <= param_count < max_p:
-                base_memory = mem
-                break
+        base_memory = _base_memory_gb(param_count)
 
         # Apply PEFT multiplier
         try:
@@ -345,11 +376,11 @@ def register_tools(mcp: FastMCP, server: RHOAIServer) -> None:
                 errors.append(f"PVC '{pvc_name}' not found in namespace '{namespace}'")
 
         # Validate model ID format
-        if not re.match(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9._-]+$", model_id):
+        if not _HF_ID_PATTERN.match(model_id):
             errors.append(f"Invalid model ID format: '{model_id}'")
 
         # Validate dataset ID format
-        if not re.match(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9._-]+$", dataset_id):
+        if not _HF_ID_PATTERN.match(dataset_id):
             errors.append(f"Invalid dataset ID format: '{dataset_id}'")
 
         return {
@@ -476,23 +507,37 @@ def register_tools(mcp: FastMCP, server: RHOAIServer) -> None:
         prereq_passed = True
 
         # Validate and normalize method parameter
-        valid_methods = {"lora", "qlora", "dora", "full"}
         method = method.lower()
-        if method not in valid_methods:
+        if method not in _VALID_METHODS:
             issues.append(
-                f"Invalid fine-tuning method: {method}. Must be one of: {', '.join(valid_methods)}"
+                f"Invalid fine-tuning method: {method}. "
+                f"Must be one of: {', '.join(sorted(_VALID_METHODS))}"
             )
             prereq_passed = False
 
         # Step 1: Estimate resources
         resource_estimate = _estimate_resources_internal(model_id, method)
 
-        # Step 2: Check prerequisites
+        # Step 2: Check prerequisites. The cluster lookups below are
+        # independent API round-trips, so issue them concurrently.
+        from rhoai_mcp.domains.training.crds import TrainingCRDs
+
         client = TrainingClient(server.k8s)
+        pvc_name = _sanitize_pvc_name("training-checkpoints", namespace)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            resources_future = executor.submit(client.get_cluster_resources)
+            runtimes_future = executor.submit(client.list_cluster_training_runtimes)
+            runtime_future = (
+                executor.submit(server.k8s.get, TrainingCRDs.CLUSTER_TRAINING_RUNTIME, runtime_name)
+                if runtime_name
+                else None
+            )
+            pvc_future = executor.submit(server.k8s.get_pvc, pvc_name, namespace)
 
         # Check cluster connectivity and GPUs
         try:
-            resources = client.get_cluster_resources()
+            resources = resources_future.result()
             if not resources.has_gpus:
                 issues.append("No GPUs available in cluster")
                 prereq_passed = False
@@ -507,7 +552,7 @@ def register_tools(mcp: FastMCP, server: RHOAIServer) -> None:
 
         # Check/select runtime
         try:
-            runtimes = client.list_cluster_training_runtimes()
+            runtimes = runtimes_future.result()
             if not runtimes:
                 issues.append("No training runtimes available")
                 prereq_passed = False
@@ -519,11 +564,9 @@ def register_tools(mcp: FastMCP, server: RHOAIServer) -> None:
             prereq_passed = False
 
         # Validate runtime if specified
-        if runtime_name:
+        if runtime_future is not None:
             try:
-                from rhoai_mcp.domains.training.crds import TrainingCRDs
-
-                server.k8s.get(TrainingCRDs.CLUSTER_TRAINING_RUNTIME, runtime_name)
+                runtime_future.result()
             except Exception:
                 issues.append(f"Runtime '{runtime_name}' not found")
                 prereq_passed = False
@@ -537,11 +580,10 @@ def register_tools(mcp: FastMCP, server: RHOAIServer) -> None:
             prereq_passed = False
 
         # Step 3: Handle storage
-        pvc_name = _sanitize_pvc_name("training-checkpoints", namespace)
         storage_exists = False
 
         try:
-            pvc = server.k8s.get_pvc(pvc_name, namespace)
+            pvc = pvc_future.result()
             if pvc.status and pvc.status.phase == "Bound":
                 storage_exists = True
         except NotFoundError:
@@ -557,21 +599,30 @@ def register_tools(mcp: FastMCP, server: RHOAIServer) -> None:
                     pvc_name=pvc_name,
                     size_gb=storage_size_gb,
                 )
-                if result.get("created") or result.get("exists"):
-                    storage_created = result.get("created", False)
-                    # Verify PVC is actually Bound before considering it ready
-                    try:
-                        pvc = server.k8s.get_pvc(pvc_name, namespace)
-                        if pvc.status and pvc.status.phase == "Bound":
-                            storage_exists = True
-                        else:
-                            phase = pvc.status.phase if pvc.status else "Unknown"
-                            warnings.append(
-                                f"PVC '{pvc_name}' exists but is not bound (phase: {phase}). "
-                                "Training may need to wait for PVC to be ready."
-                            )
-                    except NotFoundError:
-                        warnings.append(f"PVC '{pvc_name}' creation reported but not found")
+                if result.get("created"):
+                    # A freshly created PVC is always Pending until provisioned,
+                    # so it is never reported as ready storage here
+                    storage_created = True
+                    binds_immediately = result.get("binds_immediately")
+                    if binds_immediately is False:
+                        warnings.append(
+                            f"PVC '{pvc_name}' was created and will bind on first consumer "
+                            "(when the training job starts)."
+                        )
+                    elif binds_immediately is None:
+                        warnings.append(
+                            f"PVC '{pvc_name}' was created but is not bound yet. "
+                            "Training may need to wait for PVC to be ready."
+                        )
+                elif result.get("exists"):
+                    phase = result.get("status", "Unknown")
+                    if phase == "Bound":
+                        storage_exists = True
+                    else:
+                        warnings.append(
+                            f"PVC '{pvc_name}' exists but is not bound (phase: {phase}). "
+                            "Training may need to wait for PVC to be ready."
+                        )
                 elif result.get("error"):
                     warnings.append(result["error"])
             else:
@@ -617,12 +668,7 @@ def _estimate_resources_internal(model_id: str, method: str) -> dict[str, Any]:
     """
     param_count = _extract_param_count(model_id)
 
-    # Get base memory estimate
-    base_memory = 16
-    for (min_p, max_p), mem in GPU_MEMORY_ESTIMATES.items():
-        if min_p <= param_count < max_p:
-            base_memory = mem
-            break
+    base_memory = _base_memory_gb(param_count)
 
     try:
         peft_method = PeftMethod(method.lower())
@@ -646,6 +692,16 @@ def _estimate_resources_internal(model_id: str, method: str) -> dict[str, Any]:
     }
 
 
+def _base_memory_gb(param_count: float) -> int:
+    """Look up base GPU memory (GB) for a model size in GPU_MEMORY_ESTIMATES."""
+    index = bisect_right(_MEMORY_BUCKET_STARTS, param_count) - 1
+    if index >= 0:
+        (_, max_p), memory = _MEMORY_BUCKETS[index]
+        if param_count < max_p:
+            return memory
+    return _DEFAULT_BASE_MEMORY_GB
+
+
 def _sanitize_pvc_name(base_name: str, suffix: str = "") -> str:
     """Sanitize a PVC name for DNS-1123 compliance.
 
@@ -665,9 +721,9 @@ def _sanitize_pvc_name(base_name: str, suffix: str = "") -> str:
     full_name = f"{base_name}-{suffix}" if suffix else base_name
 
     # Lowercase and replace invalid characters with hyphens
-    sanitized = re.sub(r"[^a-z0-9-]", "-", full_name.lower())
+    sanitized = full_name.lower().translate(_PVC_TRANSLATION)
     # Collapse multiple hyphens
-    sanitized = re.sub(r"-+", "-", sanitized)
+    sanitized = _PVC_REPEATED_HYPHENS.sub("-", sanitized)
     # Strip leading/trailing hyphens
     sanitized = sanitized.strip("-")
 
@@ -690,6 +746,7 @@ def _sanitize_pvc_name(base_name: str, suffix: str = "") -> str:
     return sanitized
 
 
+@lru_cache(maxsize=512)
 def _extract_param_count(model_id: str) -> float:
     """Extract parameter count from model ID.
 
@@ -697,32 +754,19 @@ def _extract_param_count(model_id: str) -> float:
     - Llama-2-7b-hf -> 7
     - Qwen2.5-72B-Instruct -> 72
     - mistral-7b -> 7
+
+    Results are memoized, since agents typically ask about the same few models.
     """
     model_lower = model_id.lower()
 
-    # Try common patterns
-    patterns = [
-        r"(\d+(?:\.\d+)?)\s*b(?:illion)?",  # 7b, 70b, 7.1b
-        r"-(\d+(?:\.\d+)?)b-",  # -7b-
-        r"(\d+(?:\.\d+)?)b$",  # ends with 7b
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, model_lower)
-        if match:
-            return float(match.group(1))
+    b_match = _BILLION_PARAMS_PATTERN.search(model_lower)
+    if b_match:
+        return float(b_match.group(1))
 
-    # Check for million parameters
-    m_match = re.search(r"(\d+)m", model_lower)
+    m_match = _MILLION_PARAMS_PATTERN.search(model_lower)
     if m_match:
         return float(m_match.group(1)) / 1000
 
-    # Default estimate based on common models
-    if "llama" in model_lower:
-        return 7.0
-    if "mistral" in model_lower:
-        return 7.0
-    if "qwen" in model_lower:
-        return 7.0
-
-    return 7.0  # Default assumption
+    # Default assumption; the common model families (Llama, Mistral, Qwen)
+    # are most often used at 7B
+    return 7.0
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp import FastMCP
@@ -15,6 +16,21 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# How long an auto-detected RWX storage class is reused before re-listing.
+_RWX_SC_CACHE_TTL_SECONDS = 300.0
+
+# Common NFS/RWX storage class names (lowercase)
+_RWX_SC_NAMES = frozenset(
+    {
+        "nfs",
+        "nfs-client",
+        "nfs-csi",
+        "ocs-storagecluster-cephfs",
+        "managed-nfs-storage",
+        "trident-nfs",
+    }
+)
+
 
 def create_training_pvc(
     k8s: K8sClient,
@@ -70,7 +86,7 @@ def create_training_pvc(
 
     # Create the PVC
     try:
-        k8s.create_pvc(
+        created = k8s.create_pvc(
             name=pvc_name,
             namespace=namespace,
             size=f"{size_gb}Gi",
@@ -81,24 +97,19 @@ def create_training_pvc(
                 "app.kubernetes.io/component": "training-storage",
             },
         )
-
-        return {
-            "exists": False,
-            "created": True,
-            "pvc_name": pvc_name,
-            "namespace": namespace,
-            "size": f"{size_gb}Gi",
-            "access_mode": access_mode,
-            "storage_class": storage_class,
-            "message": f"PVC '{pvc_name}' created. It may take a moment to bind.",
-        }
     except ResourceExistsError:
         # Race condition: PVC was created between check and create
+        try:
+            existing = k8s.get_pvc(pvc_name, namespace)
+            status = existing.status.phase if existing.status else "Unknown"
+        except RHOAIError:
+            status = "Unknown"
         return {
             "exists": True,
             "created": False,
             "pvc_name": pvc_name,
             "namespace": namespace,
+            "status": status,
             "message": f"PVC '{pvc_name}' already exists.",
         }
     except RHOAIError as e:
@@ -107,6 +118,26 @@ def create_training_pvc(
             "created": False,
         }
 
+    # The API server fills in the default storage class if none was given
+    if not storage_class and created.spec:
+        storage_class = created.spec.storage_class_name
+    binding_mode = _get_volume_binding_mode(k8s, storage_class) if storage_class else None
+
+    # The PVC is still Pending here either way; an Immediate storage class
+    # only means it binds once the provisioner has created a volume,
+    # without waiting for a consuming pod. None means the mode is unknown.
+    return {
+        "exists": False,
+        "created": True,
+        "pvc_name": pvc_name,
+        "namespace": namespace,
+        "size": f"{size_gb}Gi",
+        "access_mode": access_mode,
+        "storage_class": storage_class,
+        "binds_immediately": binding_mode == "Immediate" if binding_mode else None,
+        "message": f"PVC '{pvc_name}' created. It may take a moment to bind.",
+    }
+
 
 def register_tools(mcp: FastMCP, server: RHOAIServer) -> None:
     """Register training storage tools with the MCP server."""
@@ -251,16 +282,15 @@ def register_tools(mcp: FastMCP, server: RHOAIServer) -> None:
 
 
 def _find_rwx_storage_class(k8s: Any) -> str | None:
-    """Find a storage class that supports ReadWriteMany."""
-    # Common NFS/RWX storage class names
-    common_names = [
-        "nfs",
-        "nfs-client",
-        "nfs-csi",
-        "ocs-storagecluster-cephfs",
-        "managed-nfs-storage",
-        "trident-nfs",
-    ]
+    """Find a storage class that supports ReadWriteMany.
+
+    The result is cached on the client for a few minutes, since storage
+    classes rarely change and listing them is a cluster-scoped call.
+    """
+    cache = k8s._rwx_sc_cache
+    if cache and time.monotonic() - cache[0] < _RWX_SC_CACHE_TTL_SECONDS:
+        cached_name: str | None = cache[1]
+        return cached_name
 
     try:
         # Try to list storage classes
@@ -273,17 +303,43 @@ def _find_rwx_storage_class(k8s: Any) -> str | None:
     try:
         storage_api = client.StorageV1Api(k8s._api_client)
         storage_classes = storage_api.list_storage_class()
+    except ApiException as e:
+        logger.debug("Failed to auto-detect RWX storage class: %s", e)
+        return None
 
-        for sc in storage_classes.items:
-            name: str = sc.metadata.name
-            if name.lower() in [n.lower() for n in common_names]:
-                return name
-
+    result: str | None = None
+    for sc in storage_classes.items:
+        name: str = sc.metadata.name
+        if name.lower() in _RWX_SC_NAMES:
+            result = name
+            break
+    else:
         # Return first storage class as fallback
         if storage_classes.items:
-            first_name: str = storage_classes.items[0].metadata.name
-            return first_name
-    except ApiException as e:
-        logger.debug("Failed to auto-detect RWX storage class: %s", e)
+            result = storage_classes.items[0].metadata.name
+
+    k8s._rwx_sc_cache = (time.monotonic(), result)
+    return result
+
+
+def _get_volume_binding_mode(k8s: Any, storage_class: str) -> str | None:
+    """Get a storage class's volumeBindingMode ("Immediate" or "WaitForFirstConsumer").
+
+    This is only a hint, so any lookup failure yields None rather than an
+    error. Successful lookups are cached on the client.
+    """
+    cache: dict[str, str | None] = k8s._sc_binding_modes
+    if storage_class in cache:
+        return cache[storage_class]
+
+    try:
+        from kubernetes import client  # type: ignore[import-untyped]
+
+        storage_api = client.StorageV1Api(k8s._api_client)
+        mode: str | None = storage_api.read_storage_class(storage_class).volume_binding_mode
+    except Exception as e:
+        logger.debug("Failed to read storage class %s: %s", storage_class, e)
+        return None
 
-    return None
+    cache[storage_class] = mode
+    return mode
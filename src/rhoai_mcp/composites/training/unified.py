@@ -13,7 +13,6 @@ from mcp.server.fastmcp import FastMCP
 
 from rhoai_mcp.domains.training.client import TrainingClient
 from rhoai_mcp.domains.training.models import (
-    GPU_MEMORY_ESTIMATES,
     PEFT_MULTIPLIERS,
     PeftMethod,
     TrainJobStatus,
@@ -574,15 +573,10 @@ def _action_estimate(
     if model_id is None:
         return {"error": "model_id is required for estimate action"}
 
-    from rhoai_mcp.composites.training.planning import _extract_param_count
+    from rhoai_mcp.composites.training.planning import _base_memory_gb, _extract_param_count
 
     param_count = _extract_param_count(model_id)
-
-    base_memory = 16
-    for (min_p, max_p), mem in GPU_MEMORY_ESTIMATES.items():
-        if min_p <= param_count < max_p:
-            base_memory = mem
-            break
+    base_memory = _base_memory_gb(param_count)
 
     try:
         peft_method = PeftMethod(method.lower())
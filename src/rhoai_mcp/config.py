@@ -84,6 +84,12 @@ class RHOAIConfig(BaseSettings):
         default=None,
         description="Kubernetes API token (for token auth)",
     )
+    k8s_connection_pool_maxsize: int = Field(
+        default=32,
+        ge=1,
+        le=256,
+        description="Maximum pooled HTTP connections to the Kubernetes API server",
+    )
 
     # Namespace settings
     default_namespace: str | None = Field(
@@ -1,10 +1,10 @@
 """MCP Tools for Data Connection operations."""
 
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp import FastMCP
 
-from rhoai_mcp.domains.connections.client import ConnectionClient
 from rhoai_mcp.domains.connections.models import S3DataConnectionCreate
 from rhoai_mcp.utils.response import (
     PaginatedResponse,
@@ -21,7 +21,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
     """Register data connection tools with the MCP server."""
 
     @mcp.tool()
-    def list_data_connections(
+    async def list_data_connections(
         namespace: str,
         limit: int | None = None,
         offset: int = 0,
@@ -42,8 +42,8 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         Returns:
             Paginated list of data connections with metadata (credentials masked).
         """
-        client = ConnectionClient(server.k8s)
-        all_items = client.list_data_connections(namespace)
+        client = server.connection_client
+        all_items = await asyncio.to_thread(client.list_data_connections, namespace)
 
         # Apply config limits
         effective_limit = limit
@@ -62,7 +62,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         return PaginatedResponse.build(items, total, offset, effective_limit)
 
     @mcp.tool()
-    def get_data_connection(name: str, namespace: str) -> dict[str, Any]:
+    async def get_data_connection(name: str, namespace: str) -> dict[str, Any]:
         """Get detailed information about a data connection.
 
         Sensitive values like secret keys are masked for security.
@@ -74,8 +74,10 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         Returns:
             Data connection details with masked credentials.
         """
-        client = ConnectionClient(server.k8s)
-        conn = client.get_data_connection(name, namespace, mask_secrets=True)
+        client = server.connection_client
+        conn = await asyncio.to_thread(
+            client.get_data_connection, name, namespace, mask_secrets=True
+        )
 
         return {
             "name": conn.metadata.name,
@@ -95,7 +97,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         }
 
     @mcp.tool()
-    def create_s3_data_connection(
+    async def create_s3_data_connection(
         name: str,
         namespace: str,
         aws_access_key_id: str,
@@ -128,8 +130,9 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         if not allowed:
             return {"error": reason}
 
-        client = ConnectionClient(server.k8s)
-        request = S3DataConnectionCreate(
+        client = server.connection_client
+        # Arguments were already validated against the tool signature.
+        request = S3DataConnectionCreate.model_construct(
             name=name,
             namespace=namespace,
             display_name=display_name,
@@ -139,7 +142,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
             aws_s3_bucket=aws_s3_bucket,
             aws_default_region=aws_default_region,
         )
-        conn = client.create_s3_data_connection(request)
+        conn = await asyncio.to_thread(client.create_s3_data_connection, request)
 
         return {
             "name": conn.metadata.name,
@@ -151,7 +154,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         }
 
     @mcp.tool()
-    def delete_data_connection(
+    async def delete_data_connection(
         name: str,
         namespace: str,
         confirm: bool = False,
@@ -183,8 +186,8 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
                 ),
             }
 
-        client = ConnectionClient(server.k8s)
-        client.delete_data_connection(name, namespace)
+        client = server.connection_client
+        await asyncio.to_thread(client.delete_data_connection, name, namespace)
 
         return {
             "name": name,
@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Items per API server list request, as kubectl uses
+_LIST_CHUNK_SIZE = 500
+
 
 class InferenceClient:
     """Client for InferenceService (Model Serving) operations."""
@@ -21,31 +24,90 @@ class InferenceClient:
     def __init__(self, k8s: "K8sClient") -> None:
         self._k8s = k8s
 
-    def list_inference_services(self, namespace: str) -> list[dict[str, Any]]:
-        """List all InferenceServices in a namespace."""
+    def list_inference_services(
+        self,
+        namespace: str,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """List all InferenceServices in a namespace.
+
+        Returns an empty list when the first chunk cannot be listed (e.g.
+        KServe is not installed). Failures on later chunks are raised, so a
+        partial listing is never reported as complete.
+        """
         try:
-            isvc_list = self._k8s.list_resources(
-                InferenceCRDs.INFERENCE_SERVICE, namespace=namespace
+            page = self._k8s.list_resources_page(
+                InferenceCRDs.INFERENCE_SERVICE,
+                limit=_LIST_CHUNK_SIZE,
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
             )
         except Exception:
             return []
 
-        results = []
-        for isvc in isvc_list:
-            model = InferenceService.from_inference_service_cr(isvc)
-            results.append(
-                {
-                    "name": model.metadata.name,
-                    "display_name": model.display_name,
-                    "runtime": model.runtime,
-                    "model_format": model.model_format,
-                    "status": model.status.value,
-                    "url": model.url,
-                    "_source": model.metadata.to_source_dict(),
-                }
+        results = [self._list_item(isvc) for isvc in page.items]
+        if page.continue_token:
+            results.extend(
+                self._list_item(isvc)
+                for isvc in self._k8s.iter_resources(
+                    InferenceCRDs.INFERENCE_SERVICE,
+                    namespace=namespace,
+                    chunk_size=_LIST_CHUNK_SIZE,
+                    label_selector=label_selector,
+                    field_selector=field_selector,
+                    continue_token=page.continue_token,
+                )
             )
         return results
 
+    def list_inference_services_page(
+        self,
+        namespace: str,
+        limit: int,
+        continue_token: str | None = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None, int | None]:
+        """List one page of InferenceServices using API server chunking.
+
+        Like list_inference_services, a failed first page is returned as
+        empty. Failures when continuing a listing (including an expired
+        continue token) are raised.
+
+        Returns:
+            Tuple of (items, next continue token, remaining item count).
+        """
+        try:
+            page = self._k8s.list_resources_page(
+                InferenceCRDs.INFERENCE_SERVICE,
+                limit=limit,
+                namespace=namespace,
+                continue_token=continue_token,
+                label_selector=label_selector,
+                field_selector=field_selector,
+            )
+        except Exception:
+            if continue_token:
+                raise
+            return [], None, 0
+        items = [self._list_item(isvc) for isvc in page.items]
+        return items, page.continue_token, page.remaining_item_count
+
+    def _list_item(self, isvc: Any) -> dict[str, Any]:
+        """Convert an InferenceService CR into a list entry."""
+        model = InferenceService.from_inference_service_cr(isvc)
+        return {
+            "name": model.metadata.name,
+            "display_name": model.display_name,
+            "runtime": model.runtime,
+            "model_format": model.model_format,
+            "status": model.status.value,
+            "url": model.url,
+            "_source": model.metadata.to_source_dict(),
+        }
+
     def get_inference_service(self, name: str, namespace: str) -> InferenceService:
         """Get an InferenceService by name."""
         isvc = self._k8s.get(InferenceCRDs.INFERENCE_SERVICE, name=name, namespace=namespace)
@@ -5,8 +5,8 @@ from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp import FastMCP
 
-from rhoai_mcp.domains.inference.client import InferenceClient
 from rhoai_mcp.domains.inference.models import InferenceServiceCreate
+from rhoai_mcp.utils.cache import cached, invalidate, invalidate_call
 from rhoai_mcp.utils.response import (
     PaginatedResponse,
     ResponseBuilder,
@@ -29,6 +29,9 @@ MODEL_SIZE_ESTIMATES: dict[tuple[int, int], int] = {
     (70, 200): 400,  # 70-200B params -> ~400GB
 }
 
+# Deployment status is polled while models roll out, so cache it only briefly
+_STATUS_CACHE_TTL_SECONDS = 10
+
 
 def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
     """Register model serving tools with the MCP server."""
@@ -39,6 +42,9 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         limit: int | None = None,
         offset: int = 0,
         verbosity: str = "standard",
+        continue_token: str | None = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
     ) -> dict[str, Any]:
         """List deployed models in a Data Science Project with pagination.
 
@@ -51,12 +57,24 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
             offset: Starting offset for pagination (default: 0).
             verbosity: Response detail level - "minimal", "standard", or "full".
                 Use "minimal" for quick status checks.
+            continue_token: The "continue" value from a previous response, to
+                fetch the next page. When set, offset is ignored, and pages
+                are max_list_limit items if no limit is given.
+            label_selector: Only return models whose labels match, e.g.
+                "app=fraud-detection" (filtered by the API server).
+            field_selector: Only return models whose fields match, e.g.
+                "metadata.name=my-model" (filtered by the API server).
 
         Returns:
-            Paginated list of deployed models with metadata.
+            Paginated list of deployed models with metadata. When a limit is
+            applied from the first page, the API server does the paging and
+            the response includes a "continue" token if more items remain.
+            "total" is None when the API server does not report how many
+            items remain (e.g. when a selector is set). Continued pages
+            report "offset" and "total" as None, since the API server does
+            not say how many items came before them.
         """
-        client = InferenceClient(server.k8s)
-        all_items = client.list_inference_services(namespace)
+        client = server.inference_client
 
         # Apply config limits
         effective_limit = limit
@@ -65,16 +83,46 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         elif server.config.default_list_limit is not None:
             effective_limit = server.config.default_list_limit
 
+        v = Verbosity.from_str(verbosity)
+
+        # Let the API server page when we can, so large namespaces are not
+        # listed in full just to return the first few items
+        if continue_token or (effective_limit and offset == 0):
+            page_limit = effective_limit or server.config.max_list_limit
+            page, next_token, remaining = client.list_inference_services_page(
+                namespace,
+                page_limit,
+                continue_token,
+                label_selector=label_selector,
+                field_selector=field_selector,
+            )
+            items = [ResponseBuilder.inference_service_list_item(isvc, v) for isvc in page]
+            if continue_token:
+                # Only the first page knows where it starts in the collection
+                return PaginatedResponse.build(items, None, None, page_limit, next_token)
+            total: int | None
+            if remaining is not None:
+                total = len(page) + remaining
+            elif next_token:
+                total = None  # The API server did not say how many remain
+            else:
+                total = len(page)
+            return PaginatedResponse.build(items, total, 0, page_limit, next_token)
+
+        all_items = client.list_inference_services(
+            namespace, label_selector=label_selector, field_selector=field_selector
+        )
+
         # Paginate
         paginated, total = paginate(all_items, offset, effective_limit)
 
         # Format with verbosity
-        v = Verbosity.from_str(verbosity)
         items = [ResponseBuilder.inference_service_list_item(isvc, v) for isvc in paginated]
 
         return PaginatedResponse.build(items, total, offset, effective_limit)
 
     @mcp.tool()
+    @cached("get_inference_service", ttl_seconds=_STATUS_CACHE_TTL_SECONDS)
     def get_inference_service(
         name: str,
         namespace: str,
@@ -82,6 +130,9 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
     ) -> dict[str, Any]:
         """Get detailed information about a deployed model.
 
+        The response includes the status and endpoint URLs, so there is no
+        need to call get_model_endpoint for the same model afterwards.
+
         Args:
             name: The InferenceService name.
             namespace: The project (namespace) name.
@@ -91,7 +142,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         Returns:
             Model deployment information at the requested verbosity level.
         """
-        client = InferenceClient(server.k8s)
+        client = server.inference_client
         isvc = client.get_inference_service(name, namespace)
 
         v = Verbosity.from_str(verbosity)
@@ -140,7 +191,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         if not allowed:
             return {"error": reason}
 
-        client = InferenceClient(server.k8s)
+        client = server.inference_client
         request = InferenceServiceCreate(
             name=name,
             namespace=namespace,
@@ -157,6 +208,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
             gpu_count=gpu_count,
         )
         isvc = client.deploy_model(request)
+        _invalidate_inference_service(name, namespace)
 
         return {
             "name": isvc.metadata.name,
@@ -193,8 +245,9 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
                 "message": f"To delete model deployment '{name}', set confirm=True.",
             }
 
-        client = InferenceClient(server.k8s)
+        client = server.inference_client
         client.delete_inference_service(name, namespace)
+        _invalidate_inference_service(name, namespace)
 
         return {
             "name": name,
@@ -211,6 +264,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         }
 
     @mcp.tool()
+    @cached("list_serving_runtimes")
     def list_serving_runtimes(
         namespace: str,
         include_templates: bool = True,
@@ -233,7 +287,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
             List of available serving runtimes with supported model formats.
             Runtimes from templates will have 'requires_instantiation: true'.
         """
-        client = InferenceClient(server.k8s)
+        client = server.inference_client
         runtimes = client.list_serving_runtimes(namespace, include_templates)
 
         # Separate existing and template-based runtimes for clarity
@@ -278,12 +332,13 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         if not allowed:
             return {"error": reason}
 
-        client = InferenceClient(server.k8s)
+        client = server.inference_client
         try:
             result = client.instantiate_serving_runtime_template(
                 template_name=template_name,
                 target_namespace=namespace,
             )
+            invalidate("list_serving_runtimes:")
             return {
                 "success": True,
                 "runtime_name": result["runtime"]["name"],
@@ -305,11 +360,13 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
             }
 
     @mcp.tool()
+    @cached("get_model_endpoint", ttl_seconds=_STATUS_CACHE_TTL_SECONDS)
     def get_model_endpoint(name: str, namespace: str) -> dict[str, Any]:
         """Get the inference endpoint URL for a deployed model.
 
         Returns the URL that can be used to send prediction requests
-        to the model.
+        to the model. get_inference_service already includes these URLs,
+        so use this only when the endpoint is all you need.
 
         Args:
             name: The InferenceService name.
@@ -318,7 +375,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         Returns:
             Model endpoint information including URL and status.
         """
-        client = InferenceClient(server.k8s)
+        client = server.inference_client
         result = client.get_model_endpoint(name, namespace)
 
         if result["status"] == "Ready":
@@ -368,7 +425,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
             model_format = model_info.get("format", "pytorch")
 
         # Step 2: Get available runtimes (including templates)
-        client = InferenceClient(server.k8s)
+        client = server.inference_client
         runtimes = client.list_serving_runtimes(namespace, include_templates=True)
 
         if not runtimes:
@@ -563,7 +620,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
             all_passed = False
 
         # Check 2: Serving runtime availability
-        client = InferenceClient(server.k8s)
+        client = server.inference_client
         runtimes = client.list_serving_runtimes(namespace)
 
         compatible = [
@@ -721,7 +778,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         Returns:
             Runtime recommendation with alternatives.
         """
-        client = InferenceClient(server.k8s)
+        client = server.inference_client
         runtimes = client.list_serving_runtimes(namespace)
 
         if not runtimes:
@@ -789,7 +846,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         Returns:
             Endpoint test results with accessibility status.
         """
-        client = InferenceClient(server.k8s)
+        client = server.inference_client
 
         try:
             isvc = client.get_inference_service(name, namespace)
@@ -829,6 +886,12 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         return result
 
 
+def _invalidate_inference_service(name: str, namespace: str) -> None:
+    """Drop cached tool results for an InferenceService after it changes."""
+    invalidate_call("get_inference_service", name=name, namespace=namespace)
+    invalidate_call("get_model_endpoint", name=name, namespace=namespace)
+
+
 def _estimate_model_info(model_id: str) -> dict[str, Any]:
     """Estimate model information from model ID."""
     model_lower = model_id.lower()
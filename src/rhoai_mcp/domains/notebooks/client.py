@@ -16,6 +16,45 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Common RHOAI notebook images, built once at import
+_STANDARD_NOTEBOOK_IMAGES: tuple[NotebookImage, ...] = (
+    NotebookImage(
+        name="image-registry.openshift-image-registry.svc:5000/redhat-ods-applications/jupyter-datascience-notebook:2024.1",
+        display_name="Jupyter Data Science",
+        description="Standard data science notebook with common ML libraries",
+        recommended=True,
+        order=1,
+    ),
+    NotebookImage(
+        name="image-registry.openshift-image-registry.svc:5000/redhat-ods-applications/jupyter-pytorch-notebook:2024.1",
+        display_name="PyTorch",
+        description="Notebook with PyTorch deep learning framework",
+        recommended=False,
+        order=2,
+    ),
+    NotebookImage(
+        name="image-registry.openshift-image-registry.svc:5000/redhat-ods-applications/jupyter-tensorflow-notebook:2024.1",
+        display_name="TensorFlow",
+        description="Notebook with TensorFlow deep learning framework",
+        recommended=False,
+        order=3,
+    ),
+    NotebookImage(
+        name="image-registry.openshift-image-registry.svc:5000/redhat-ods-applications/code-server-notebook:2024.1",
+        display_name="VS Code (Code Server)",
+        description="VS Code-based development environment",
+        recommended=False,
+        order=4,
+    ),
+    NotebookImage(
+        name="image-registry.openshift-image-registry.svc:5000/redhat-ods-applications/rstudio-notebook:2024.1",
+        display_name="RStudio",
+        description="RStudio development environment",
+        recommended=False,
+        order=5,
+    ),
+)
+
 
 class NotebookClient:
     """Client for Notebook (Workbench) operations."""
@@ -36,6 +75,11 @@ class NotebookClient:
         notebook = self._k8s.get(NotebookCRDs.NOTEBOOK, name=name, namespace=namespace)
         return Workbench.from_notebook_cr(notebook, url=self._get_workbench_url(name, namespace))
 
+    def get_workbench_summary(self, name: str, namespace: str) -> dict[str, Any]:
+        """Get a workbench's URL and status without parsing the full spec."""
+        notebook = self._k8s.get(NotebookCRDs.NOTEBOOK, name=name, namespace=namespace)
+        return Workbench.summary_from_cr(notebook, url=self._get_workbench_url(name, namespace))
+
     def create_workbench(self, request: WorkbenchCreate) -> Workbench:
         """Create a new workbench."""
         # Build the Notebook CR
@@ -95,44 +139,7 @@ class NotebookClient:
         In a real implementation, this would query the cluster's
         ImageStream resources or a configuration.
         """
-        # Common RHOAI notebook images
-        return [
-            NotebookImage(
-                name="image-registry.openshift-image-registry.svc:5000/redhat-ods-applications/jupyter-datascience-notebook:2024.1",
-                display_name="Jupyter Data Science",
-                description="Standard data science notebook with common ML libraries",
-                recommended=True,
-                order=1,
-            ),
-            NotebookImage(
-                name="image-registry.openshift-image-registry.svc:5000/redhat-ods-applications/jupyter-pytorch-notebook:2024.1",
-                display_name="PyTorch",
-                description="Notebook with PyTorch deep learning framework",
-                recommended=False,
-                order=2,
-            ),
-            NotebookImage(
-                name="image-registry.openshift-image-registry.svc:5000/redhat-ods-applications/jupyter-tensorflow-notebook:2024.1",
-                display_name="TensorFlow",
-                description="Notebook with TensorFlow deep learning framework",
-                recommended=False,
-                order=3,
-            ),
-            NotebookImage(
-                name="image-registry.openshift-image-registry.svc:5000/redhat-ods-applications/code-server-notebook:2024.1",
-                display_name="VS Code (Code Server)",
-                description="VS Code-based development environment",
-                recommended=False,
-                order=4,
-            ),
-            NotebookImage(
-                name="image-registry.openshift-image-registry.svc:5000/redhat-ods-applications/rstudio-notebook:2024.1",
-                display_name="RStudio",
-                description="RStudio development environment",
-                recommended=False,
-                order=5,
-            ),
-        ]
+        return list(_STANDARD_NOTEBOOK_IMAGES)
 
     def get_workbench_url(self, name: str, namespace: str) -> str | None:
         """Get the URL for accessing a workbench.
@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from rhoai_mcp.models.common import (
     Condition,
@@ -27,7 +27,12 @@ class WorkbenchStatus(str, Enum):
 
 
 class NotebookImage(BaseModel):
-    """Notebook image information."""
+    """Notebook image information.
+
+    Frozen so the standard image list can be shared between calls.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     name: str = Field(..., description="Image name/tag")
     display_name: str | None = Field(None, description="Human-readable name")
@@ -130,6 +135,19 @@ class Workbench(BaseModel):
             env_from=env_from,
         )
 
+    @classmethod
+    def summary_from_cr(cls, notebook: Any, url: str | None = None) -> dict[str, Any]:
+        """Build a name, URL and status summary without parsing the full spec."""
+        status = cls._determine_status(
+            notebook.metadata.annotations or {}, getattr(notebook, "status", None)
+        )
+        return {
+            "name": notebook.metadata.name,
+            "namespace": notebook.metadata.namespace,
+            "url": url,
+            "status": status.value,
+        }
+
     @staticmethod
     def _determine_status(annotations: dict[str, Any], status_obj: Any) -> WorkbenchStatus:
         """Determine workbench status from annotations and status object."""
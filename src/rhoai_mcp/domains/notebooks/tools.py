@@ -1,10 +1,11 @@
 """MCP Tools for Notebook (Workbench) operations."""
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
 from mcp.server.fastmcp import FastMCP
 
-from rhoai_mcp.domains.notebooks.client import NotebookClient
 from rhoai_mcp.domains.notebooks.models import WorkbenchCreate
 from rhoai_mcp.utils.response import (
     PaginatedResponse,
@@ -16,12 +17,43 @@ from rhoai_mcp.utils.response import (
 if TYPE_CHECKING:
     from rhoai_mcp.server import RHOAIServer
 
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
 
 def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
     """Register workbench management tools with the MCP server."""
 
+    # Reads in flight, keyed by the client method and its call arguments
+    inflight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+
+    async def read_shared(func: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs) -> _T:
+        """Run a blocking NotebookClient read in a worker thread.
+
+        Calls to the same method with the same arguments while the read is
+        in flight share its result.
+        """
+        key = (getattr(func, "__qualname__", func), args, tuple(sorted(kwargs.items())))
+        future = inflight.get(key)
+        if future is None or future.done():
+            future = asyncio.ensure_future(asyncio.to_thread(func, *args, **kwargs))
+            inflight[key] = future
+
+            def evict(done: asyncio.Future[Any]) -> None:
+                # A newer read may already own the key once this one finished
+                if inflight.get(key) is done:
+                    del inflight[key]
+                # Mark a failure as retrieved even if every caller was cancelled
+                if not done.cancelled():
+                    done.exception()
+
+            future.add_done_callback(evict)
+        # Shield so a cancelled caller does not cancel the read for the others
+        result: _T = await asyncio.shield(future)
+        return result
+
     @mcp.tool()
-    def list_workbenches(
+    async def list_workbenches(
         namespace: str,
         limit: int | None = None,
         offset: int = 0,
@@ -42,8 +74,8 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         Returns:
             Paginated list of workbenches with metadata.
         """
-        client = NotebookClient(server.k8s)
-        workbenches = client.list_workbenches(namespace)
+        client = server.notebook_client
+        workbenches = await asyncio.to_thread(client.list_workbenches, namespace)
 
         # Apply config limits
         effective_limit = limit
@@ -62,7 +94,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         return PaginatedResponse.build(items, total, offset, effective_limit)
 
     @mcp.tool()
-    def get_workbench(
+    async def get_workbench(
         name: str,
         namespace: str,
         verbosity: str = "full",
@@ -78,14 +110,14 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         Returns:
             Workbench information at the requested verbosity level.
         """
-        client = NotebookClient(server.k8s)
-        wb = client.get_workbench(name, namespace)
+        client = server.notebook_client
+        wb = await read_shared(client.get_workbench, name, namespace)
 
         v = Verbosity.from_str(verbosity)
         return ResponseBuilder.workbench_detail(wb, v)
 
     @mcp.tool()
-    def create_workbench(
+    async def create_workbench(
         name: str,
         namespace: str,
         image: str,
@@ -128,8 +160,9 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         if not allowed:
             return {"error": reason}
 
-        client = NotebookClient(server.k8s)
-        request = WorkbenchCreate(
+        client = server.notebook_client
+        # Arguments were already validated against the tool signature.
+        request = WorkbenchCreate.model_construct(
             name=name,
             namespace=namespace,
             display_name=display_name,
@@ -144,7 +177,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
             data_connections=data_connections or [],
             additional_pvcs=additional_pvcs or [],
         )
-        wb = client.create_workbench(request)
+        wb = await asyncio.to_thread(client.create_workbench, request)
 
         return {
             "name": wb.metadata.name,
@@ -156,7 +189,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         }
 
     @mcp.tool()
-    def start_workbench(name: str, namespace: str) -> dict[str, Any]:
+    async def start_workbench(name: str, namespace: str) -> dict[str, Any]:
         """Start a stopped workbench.
 
         Removes the kubeflow-resource-stopped annotation to allow the
@@ -174,8 +207,8 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         if not allowed:
             return {"error": reason}
 
-        client = NotebookClient(server.k8s)
-        wb = client.start_workbench(name, namespace)
+        client = server.notebook_client
+        wb = await asyncio.to_thread(client.start_workbench, name, namespace)
 
         return {
             "name": wb.metadata.name,
@@ -186,7 +219,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         }
 
     @mcp.tool()
-    def stop_workbench(name: str, namespace: str) -> dict[str, Any]:
+    async def stop_workbench(name: str, namespace: str) -> dict[str, Any]:
         """Stop a running workbench.
 
         Adds the kubeflow-resource-stopped annotation which causes the
@@ -204,8 +237,8 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         if not allowed:
             return {"error": reason}
 
-        client = NotebookClient(server.k8s)
-        wb = client.stop_workbench(name, namespace)
+        client = server.notebook_client
+        wb = await asyncio.to_thread(client.stop_workbench, name, namespace)
 
         return {
             "name": wb.metadata.name,
@@ -216,7 +249,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         }
 
     @mcp.tool()
-    def delete_workbench(
+    async def delete_workbench(
         name: str,
         namespace: str,
         confirm: bool = False,
@@ -248,8 +281,8 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
                 ),
             }
 
-        client = NotebookClient(server.k8s)
-        client.delete_workbench(name, namespace)
+        client = server.notebook_client
+        await asyncio.to_thread(client.delete_workbench, name, namespace)
 
         return {
             "name": name,
@@ -275,7 +308,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         Returns:
             List of available images with display names and descriptions.
         """
-        client = NotebookClient(server.k8s)
+        client = server.notebook_client
         images = client.list_notebook_images()
 
         return [
@@ -289,7 +322,7 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         ]
 
     @mcp.tool()
-    def get_workbench_url(name: str, namespace: str) -> dict[str, Any]:
+    async def get_workbench_url(name: str, namespace: str) -> dict[str, Any]:
         """Get the access URL for a workbench.
 
         Returns the OAuth-protected route URL for accessing the workbench
@@ -302,17 +335,14 @@ def register_tools(mcp: FastMCP, server: "RHOAIServer") -> None:
         Returns:
             The workbench URL and current status.
         """
-        client = NotebookClient(server.k8s)
-        wb = client.get_workbench(name, namespace)
+        client = server.notebook_client
+        summary = await read_shared(client.get_workbench_summary, name, namespace)
 
-        return {
-            "name": wb.metadata.name,
-            "namespace": wb.metadata.namespace,
-            "url": wb.url,
-            "status": wb.status.value,
-            "message": (
-                "Workbench is accessible at the URL"
-                if wb.status.value == "Running"
-                else f"Workbench is {wb.status.value} - URL may not be accessible"
-            ),
-        }
+        # The summary may be shared with concurrent callers, so copy it
+        result = dict(summary)
+        if result["status"] == "Running":
+            result["message"] = "Workbench is accessible at the URL"
+        else:
+            result["message"] = f"Workbench is {result['status']} - URL may not be accessible"
+
+        return result
@@ -1,5 +1,6 @@
 """Project (namespace) client operations."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from rhoai_mcp.domains.projects.models import DataScienceProject, ProjectCreate
@@ -10,6 +11,10 @@ from rhoai_mcp.utils.labels import RHOAILabels
 if TYPE_CHECKING:
     from rhoai_mcp.clients.base import K8sClient
 
+# Shared by all resource summaries, so summarizing many projects reuses the
+# same worker threads instead of starting a pool per project
+_SUMMARY_EXECUTOR = ThreadPoolExecutor(max_workers=5, thread_name_prefix="project-summary")
+
 
 class ProjectClient:
     """Client for Data Science Project operations."""
@@ -127,77 +132,87 @@ class ProjectClient:
         return self.get_project(name)
 
     def _get_resource_summary(self, namespace: str) -> ResourceSummary:
-        """Get resource counts for a namespace."""
-        # Import here to avoid circular imports when other domains not available
-        workbenches = 0
-        workbenches_running = 0
-        models = 0
-        models_ready = 0
-        pipelines = 0
-        data_connections = 0
-        storage = 0
-
-        # Count workbenches (use domain CRDs)
+        """Get resource counts for a namespace.
+
+        Each resource kind is a separate list call, so they run concurrently.
+        """
+        workbenches_future = _SUMMARY_EXECUTOR.submit(self._count_workbenches, namespace)
+        models_future = _SUMMARY_EXECUTOR.submit(self._count_models, namespace)
+        connections_future = _SUMMARY_EXECUTOR.submit(self._count_data_connections, namespace)
+        storage_future = _SUMMARY_EXECUTOR.submit(self._count_storage, namespace)
+        pipelines_future = _SUMMARY_EXECUTOR.submit(self._count_pipelines, namespace)
+
+        workbenches, workbenches_running = workbenches_future.result()
+        models, models_ready = models_future.result()
+
+        return ResourceSummary(
+            workbenches=workbenches,
+            workbenches_running=workbenches_running,
+            models=models,
+            models_ready=models_ready,
+            pipelines=pipelines_future.result(),
+            data_connections=connections_future.result(),
+            storage=storage_future.result(),
+        )
+
+    # Domain CRDs are imported here to avoid circular imports when other
+    # domains are not available. Each count falls back to zero on error.
+
+    def _count_workbenches(self, namespace: str) -> tuple[int, int]:
+        """Count workbenches and how many of them are running."""
         try:
             from rhoai_mcp.domains.notebooks.crds import NotebookCRDs
 
             notebooks = self._k8s.list_resources(NotebookCRDs.NOTEBOOK, namespace=namespace)
-            workbenches = len(notebooks)
-            workbenches_running = sum(
+            running = sum(
                 1
                 for nb in notebooks
                 if not RHOAIAnnotations.is_notebook_stopped(nb.metadata.annotations or {})
             )
+            return len(notebooks), running
         except Exception:
-            pass
+            return 0, 0
 
-        # Count models (use domain CRDs)
+    def _count_models(self, namespace: str) -> tuple[int, int]:
+        """Count deployed models and how many of them are ready."""
         try:
             from rhoai_mcp.domains.inference.crds import InferenceCRDs
 
             isvc = self._k8s.list_resources(InferenceCRDs.INFERENCE_SERVICE, namespace=namespace)
-            models = len(isvc)
-            models_ready = sum(1 for svc in isvc if self._is_inference_service_ready(svc))
+            ready = sum(1 for svc in isvc if self._is_inference_service_ready(svc))
+            return len(isvc), ready
         except Exception:
-            pass
+            return 0, 0
 
-        # Count data connections
+    def _count_data_connections(self, namespace: str) -> int:
+        """Count dashboard secrets that are data connections."""
         try:
             label_selector = RHOAILabels.filter_selector(**{RHOAILabels.DASHBOARD: "true"})
             secrets = self._k8s.list_secrets(namespace=namespace, label_selector=label_selector)
-            # Filter to only data connections
-            for secret in secrets:
-                annotations = secret.metadata.annotations or {}
-                if RHOAIAnnotations.CONNECTION_TYPE in annotations:
-                    data_connections += 1
+            return sum(
+                1
+                for secret in secrets
+                if RHOAIAnnotations.CONNECTION_TYPE in (secret.metadata.annotations or {})
+            )
         except Exception:
-            pass
+            return 0
 
-        # Count PVCs
+    def _count_storage(self, namespace: str) -> int:
+        """Count PVCs."""
         try:
-            pvcs = self._k8s.list_pvcs(namespace=namespace)
-            storage = len(pvcs)
+            return len(self._k8s.list_pvcs(namespace=namespace))
         except Exception:
-            pass
+            return 0
 
-        # Count pipelines (check if DSPA exists)
+    def _count_pipelines(self, namespace: str) -> int:
+        """Count pipeline servers (1 if a DSPA exists)."""
         try:
             from rhoai_mcp.domains.pipelines.crds import PipelinesCRDs
 
             dspas = self._k8s.list_resources(PipelinesCRDs.DSPA, namespace=namespace)
-            pipelines = 1 if dspas else 0
+            return 1 if dspas else 0
         except Exception:
-            pass
-
-        return ResourceSummary(
-            workbenches=workbenches,
-            workbenches_running=workbenches_running,
-            models=models,
-            models_ready=models_ready,
-            pipelines=pipelines,
-            data_connections=data_connections,
-            storage=storage,
-        )
+            return 0
 
     @staticmethod
     def _is_inference_service_ready(isvc: Any) -> bool:
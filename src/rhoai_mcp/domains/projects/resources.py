@@ -61,9 +61,7 @@ def register_resources(mcp: FastMCP, server: "RHOAIServer") -> None:
         and access URL.
         """
         try:
-            from rhoai_mcp.domains.notebooks.client import NotebookClient
-
-            notebook_client = NotebookClient(server.k8s)
+            notebook_client = server.notebook_client
             workbenches = notebook_client.list_workbenches(name)
 
             return [
@@ -93,9 +91,7 @@ def register_resources(mcp: FastMCP, server: "RHOAIServer") -> None:
         Returns all InferenceServices with their status and endpoints.
         """
         try:
-            from rhoai_mcp.domains.inference.client import InferenceClient
-
-            inference_client = InferenceClient(server.k8s)
+            inference_client = server.inference_client
             return inference_client.list_inference_services(name)
         except ImportError:
             return [{"error": "Inference domain not available"}]
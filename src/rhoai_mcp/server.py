@@ -17,7 +17,9 @@ from rhoai_mcp.config import RHOAIConfig, get_config
 from rhoai_mcp.plugin_manager import PluginManager
 
 if TYPE_CHECKING:
-    pass
+    from rhoai_mcp.domains.connections.client import ConnectionClient
+    from rhoai_mcp.domains.inference.client import InferenceClient
+    from rhoai_mcp.domains.notebooks.client import NotebookClient
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,9 @@ class RHOAIServer:
         self._k8s_client: K8sClient | None = None
         self._mcp: FastMCP | None = None
         self._plugin_manager: PluginManager | None = None
+        self._notebook_client: NotebookClient | None = None
+        self._inference_client: InferenceClient | None = None
+        self._connection_client: ConnectionClient | None = None
 
     @property
     def config(self) -> RHOAIConfig:
@@ -47,6 +52,33 @@ class RHOAIServer:
             raise RuntimeError("Server not running. K8s client not available.")
         return self._k8s_client
 
+    @property
+    def notebook_client(self) -> NotebookClient:
+        """Get the shared workbench client, created on first use."""
+        if self._notebook_client is None:
+            from rhoai_mcp.domains.notebooks.client import NotebookClient
+
+            self._notebook_client = NotebookClient(self.k8s)
+        return self._notebook_client
+
+    @property
+    def inference_client(self) -> InferenceClient:
+        """Get the shared model serving client, created on first use."""
+        if self._inference_client is None:
+            from rhoai_mcp.domains.inference.client import InferenceClient
+
+            self._inference_client = InferenceClient(self.k8s)
+        return self._inference_client
+
+    @property
+    def connection_client(self) -> ConnectionClient:
+        """Get the shared data connection client, created on first use."""
+        if self._connection_client is None:
+            from rhoai_mcp.domains.connections.client import ConnectionClient
+
+            self._connection_client = ConnectionClient(self.k8s)
+        return self._connection_client
+
     @property
     def mcp(self) -> FastMCP:
         """Get the MCP server instance.
@@ -121,6 +153,9 @@ class RHOAIServer:
                 if server_self._k8s_client:
                     server_self._k8s_client.disconnect()
                 server_self._k8s_client = None
+                server_self._notebook_client = None
+                server_self._inference_client = None
+                server_self._connection_client = None
                 logger.info("RHOAI MCP server shut down")
 
         return lifespan
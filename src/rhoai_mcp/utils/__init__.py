@@ -7,6 +7,7 @@ from rhoai_mcp.utils.cache import (
     clear_cache,
     clear_expired,
     invalidate,
+    invalidate_call,
 )
 from rhoai_mcp.utils.errors import (
     AuthenticationError,
@@ -53,6 +54,7 @@ __all__ = [
     "clear_expired",
     "cache_stats",
     "invalidate",
+    "invalidate_call",
     # Port forwarding
     "PortForwardConnection",
     "PortForwardError",
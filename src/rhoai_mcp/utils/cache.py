@@ -5,6 +5,7 @@ to client methods to cache responses and reduce Kubernetes API calls.
 Caching is disabled by default and must be explicitly enabled via config.
 """
 
+import inspect
 import time
 from collections.abc import Callable
 from functools import wraps
@@ -15,8 +16,8 @@ from rhoai_mcp.config import get_config
 
 F = TypeVar("F", bound=Callable[..., Any])
 
-# Thread-safe cache storage
-_cache: dict[str, tuple[float, Any]] = {}
+# Thread-safe cache storage: key -> (cached_time, value, ttl_seconds)
+_cache: dict[str, tuple[float, Any, float]] = {}
 _cache_lock = Lock()
 
 
@@ -38,14 +39,18 @@ def _make_cache_key(prefix: str, args: tuple[Any, ...], kwargs: dict[str, Any])
     return ":".join(key_parts)
 
 
-def cached(key_prefix: str | None = None) -> Callable[[F], F]:
+def cached(key_prefix: str | None = None, ttl_seconds: float | None = None) -> Callable[[F], F]:
     """TTL-based caching decorator for client methods.
 
     The cache is only active when config.enable_response_caching is True.
-    Cache entries expire after config.cache_ttl_seconds.
+    Cache entries expire after config.cache_ttl_seconds, or ttl_seconds
+    when given. Arguments are bound to parameter names before building the
+    key, so positional, keyword and defaulted calls share an entry.
 
     Args:
         key_prefix: Optional key prefix. Defaults to function name.
+        ttl_seconds: Optional TTL for this function's entries, overriding
+            config.cache_ttl_seconds.
 
     Returns:
         Decorated function with caching.
@@ -57,6 +62,8 @@ def cached(key_prefix: str | None = None) -> Callable[[F], F]:
     """
 
     def decorator(fn: F) -> F:
+        signature = inspect.signature(fn)
+
         @wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             config = get_config()
@@ -67,13 +74,15 @@ def cached(key_prefix: str | None = None) -> Callable[[F], F]:
 
             # Generate cache key
             prefix = key_prefix or fn.__name__
-            cache_key = _make_cache_key(prefix, args, kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            cache_key = _make_cache_key(prefix, (), bound.arguments)
 
             # Check cache
             with _cache_lock:
                 if cache_key in _cache:
-                    cached_time, cached_value = _cache[cache_key]
-                    if time.time() - cached_time < config.cache_ttl_seconds:
+                    cached_time, cached_value, ttl = _cache[cache_key]
+                    if time.time() - cached_time < ttl:
                         return cached_value
                     # Expired, remove it
                     del _cache[cache_key]
@@ -82,8 +91,9 @@ def cached(key_prefix: str | None = None) -> Callable[[F], F]:
             result = fn(*args, **kwargs)
 
             # Store in cache
+            ttl = ttl_seconds if ttl_seconds is not None else config.cache_ttl_seconds
             with _cache_lock:
-                _cache[cache_key] = (time.time(), result)
+                _cache[cache_key] = (time.time(), result, ttl)
 
             return result
 
@@ -110,15 +120,12 @@ def clear_expired() -> int:
     Returns:
         Number of entries cleared.
     """
-    config = get_config()
     now = time.time()
     cleared = 0
 
     with _cache_lock:
         expired_keys = [
-            key
-            for key, (cached_time, _) in _cache.items()
-            if now - cached_time >= config.cache_ttl_seconds
+            key for key, (cached_time, _, ttl) in _cache.items() if now - cached_time >= ttl
         ]
         for key in expired_keys:
             del _cache[key]
@@ -138,9 +145,7 @@ def cache_stats() -> dict[str, Any]:
 
     with _cache_lock:
         total = len(_cache)
-        expired = sum(
-            1 for cached_time, _ in _cache.values() if now - cached_time >= config.cache_ttl_seconds
-        )
+        expired = sum(1 for cached_time, _, ttl in _cache.values() if now - cached_time >= ttl)
 
     return {
         "total_entries": total,
@@ -165,3 +170,28 @@ def invalidate(pattern: str) -> int:
         for key in keys_to_remove:
             del _cache[key]
         return len(keys_to_remove)
+
+
+def invalidate_call(prefix: str, **params: Any) -> int:
+    """Invalidate cached results of a function called with the given arguments.
+
+    Keys are matched argument by argument, the same way cached() builds
+    them, so arguments that are not given (e.g. verbosity) match any value.
+
+    Args:
+        prefix: Key prefix the function was cached under.
+        **params: Argument values the cached calls must have been made with.
+
+    Returns:
+        Number of entries invalidated.
+    """
+    wanted = {f"{k}={v}" for k, v in params.items()}
+    with _cache_lock:
+        keys_to_remove = []
+        for key in _cache:
+            key_prefix, *parts = key.split(":")
+            if key_prefix == prefix and wanted.issubset(parts):
+                keys_to_remove.append(key)
+        for key in keys_to_remove:
+            del _cache[key]
+        return len(keys_to_remove)
@@ -37,28 +37,35 @@ class PaginatedResponse:
     @staticmethod
     def build(
         items: list[dict[str, Any]],
-        total: int,
-        offset: int = 0,
+        total: int | None,
+        offset: int | None = 0,
         limit: int | None = None,
+        continue_token: str | None = None,
     ) -> dict[str, Any]:
         """Build a paginated response with metadata.
 
         Args:
             items: The paginated items to return.
-            total: Total count of items before pagination.
-            offset: Starting offset used.
+            total: Total count of items before pagination, or None if unknown.
+            offset: Starting offset used, or None if unknown.
             limit: Limit used (None means all items).
+            continue_token: Token for the next page when the API server did
+                the paging. Added to the response as "continue".
 
         Returns:
             Response dict with items and pagination metadata.
         """
-        return {
+        response: dict[str, Any] = {
             "items": items,
             "total": total,
             "offset": offset,
             "limit": limit,
-            "has_more": offset + len(items) < total,
+            "has_more": continue_token is not None
+            or (total is not None and offset is not None and offset + len(items) < total),
         }
+        if continue_token is not None:
+            response["continue"] = continue_token
+        return response
 
 
 def paginate(
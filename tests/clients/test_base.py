@@ -0,0 +1,163 @@
+"""Tests for the base Kubernetes client."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client import ApiException
+
+from rhoai_mcp.clients.base import CRDDefinition, K8sClient, ResourcePage
+from rhoai_mcp.config import AuthMode, RHOAIConfig
+from rhoai_mcp.utils.errors import RHOAIError
+
+WIDGET = CRDDefinition(group="example.com", version="v1", plural="widgets", kind="Widget")
+
+
+class TestApiClientCreation:
+    """Tests for ApiClient construction."""
+
+    def test_token_client_uses_configured_pool_size(self) -> None:
+        """Token auth clients get the configured connection pool size."""
+        config = RHOAIConfig(
+            auth_mode=AuthMode.TOKEN,
+            api_server="https://api.cluster.example.com:6443",
+            api_token="sha256~token",
+            k8s_connection_pool_maxsize=48,
+        )
+
+        api_client = K8sClient(config)._create_api_client()
+
+        assert api_client.configuration.connection_pool_maxsize == 48
+        assert api_client.rest_client.pool_manager.connection_pool_kw["maxsize"] == 48
+
+    def test_kubeconfig_client_uses_configured_pool_size(self, tmp_path) -> None:
+        """Kubeconfig clients load into a configuration with the pool size set."""
+        kubeconfig = tmp_path / "config"
+        kubeconfig.touch()
+        config = RHOAIConfig(
+            auth_mode=AuthMode.KUBECONFIG,
+            kubeconfig_path=kubeconfig,
+            k8s_connection_pool_maxsize=48,
+        )
+
+        with patch("rhoai_mcp.clients.base.config.new_client_from_config") as mock_new:
+            K8sClient(config)._create_api_client()
+
+        configuration = mock_new.call_args.kwargs["client_configuration"]
+        assert configuration.connection_pool_maxsize == 48
+
+
+class TestGetResource:
+    """Tests for K8sClient.get_resource discovery caching."""
+
+    def test_concurrent_first_lookups_discover_once(self) -> None:
+        """Concurrent first lookups share a single discovery search."""
+        k8s = K8sClient(RHOAIConfig())
+        barrier = threading.Barrier(4)
+        dynamic = MagicMock()
+
+        def slow_search(**_: object) -> list[MagicMock]:
+            time.sleep(0.05)
+            return [MagicMock()]
+
+        dynamic.resources.search.side_effect = slow_search
+        k8s._dynamic_client = dynamic
+
+        def lookup() -> object:
+            barrier.wait()
+            return k8s.get_resource(WIDGET)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: lookup(), range(4)))
+
+        assert dynamic.resources.search.call_count == 1
+        assert all(result is results[0] for result in results)
+
+
+class TestListResourcesPage:
+    """Tests for K8sClient.list_resources_page."""
+
+    @pytest.fixture
+    def resource(self) -> MagicMock:
+        """Create a mock dynamic resource returned by discovery."""
+        return MagicMock()
+
+    @pytest.fixture
+    def k8s(self, resource: MagicMock) -> K8sClient:
+        """Create a K8sClient whose Widget discovery is pre-cached."""
+        k8s = K8sClient(RHOAIConfig())
+        k8s._crd_cache[f"{WIDGET.api_version}/{WIDGET.plural}"] = resource
+        return k8s
+
+    def test_passes_limit_and_continue(self, k8s: K8sClient, resource: MagicMock) -> None:
+        """The limit and continue token are forwarded to the API server."""
+        result = MagicMock(items=["a", "b"])
+        result.metadata = MagicMock(**{"continue": "next", "remainingItemCount": 3})
+        resource.get.return_value = result
+
+        page = k8s.list_resources_page(WIDGET, limit=2, namespace="ns", continue_token="tok")
+
+        resource.get.assert_called_once_with(limit=2, namespace="ns", _continue="tok")
+        assert page.items == ["a", "b"]
+        assert page.continue_token == "next"
+        assert page.remaining_item_count == 3
+
+    def test_passes_selectors(self, k8s: K8sClient, resource: MagicMock) -> None:
+        """Label and field selectors are forwarded to the API server."""
+        resource.get.return_value = MagicMock(items=[])
+
+        k8s.list_resources_page(
+            WIDGET, limit=2, label_selector="app=x", field_selector="metadata.name=y"
+        )
+
+        resource.get.assert_called_once_with(
+            limit=2, label_selector="app=x", field_selector="metadata.name=y"
+        )
+
+    def test_last_page_has_no_token(self, k8s: K8sClient, resource: MagicMock) -> None:
+        """An empty continue value marks the last page."""
+        result = MagicMock(items=["a"])
+        result.metadata = MagicMock(**{"continue": "", "remainingItemCount": None})
+        resource.get.return_value = result
+
+        page = k8s.list_resources_page(WIDGET, limit=2)
+
+        assert page.continue_token is None
+
+    def test_expired_token(self, k8s: K8sClient, resource: MagicMock) -> None:
+        """An expired continue token raises a descriptive error."""
+        resource.get.side_effect = ApiException(status=410, reason="Gone")
+
+        with pytest.raises(RHOAIError, match="expired"):
+            k8s.list_resources_page(WIDGET, limit=2, continue_token="old")
+
+
+class TestIterResources:
+    """Tests for K8sClient.iter_resources."""
+
+    def test_follows_continue_tokens(self) -> None:
+        """Pages are fetched until the API server stops returning a token."""
+        k8s = K8sClient(RHOAIConfig())
+        pages = [
+            ResourcePage(items=["a", "b"], continue_token="t1", remaining_item_count=1),
+            ResourcePage(items=["c"], continue_token=None, remaining_item_count=None),
+        ]
+
+        with patch.object(k8s, "list_resources_page", side_effect=pages) as mock_page:
+            items = list(k8s.iter_resources(WIDGET, namespace="ns", chunk_size=2))
+
+        assert items == ["a", "b", "c"]
+        assert [c.kwargs["continue_token"] for c in mock_page.call_args_list] == [None, "t1"]
+
+    def test_resumes_from_continue_token(self) -> None:
+        """Iteration can start after a page the caller already fetched."""
+        k8s = K8sClient(RHOAIConfig())
+        page = ResourcePage(items=["c"], continue_token=None, remaining_item_count=None)
+
+        with patch.object(k8s, "list_resources_page", return_value=page) as mock_page:
+            items = list(k8s.iter_resources(WIDGET, continue_token="t1"))
+
+        assert items == ["c"]
+        assert mock_page.call_args.kwargs["continue_token"] == "t1"
@@ -1,6 +1,6 @@
 """Tests for diagnose_resource diagnostic functions."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -27,17 +27,14 @@ class TestDiagnoseModel:
         mock_isvc.url = "https://my-model.example.com"
         mock_isvc.storage_uri = "s3://bucket/model"
 
-        with patch(
-            "rhoai_mcp.domains.inference.client.InferenceClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_inference_service.return_value = mock_isvc
-            mock_client.get_inference_service_events.return_value = [
-                {"type": "Normal", "reason": "Created", "message": "Created"}
-            ]
-            mock_client.get_inference_service_logs.return_value = "Model loaded"
+        mock_client = mock_server.inference_client
+        mock_client.get_inference_service.return_value = mock_isvc
+        mock_client.get_inference_service_events.return_value = [
+            {"type": "Normal", "reason": "Created", "message": "Created"}
+        ]
+        mock_client.get_inference_service_logs.return_value = "Model loaded"
 
-            result = _diagnose_model(mock_server, "my-model", "test-ns")
+        result = _diagnose_model(mock_server, "my-model", "test-ns")
 
         assert result["resource"]["name"] == "my-model"
         assert result["resource"]["status"] == "Ready"
@@ -57,15 +54,12 @@ class TestDiagnoseModel:
         mock_isvc.url = None
         mock_isvc.storage_uri = None
 
-        with patch(
-            "rhoai_mcp.domains.inference.client.InferenceClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_inference_service.return_value = mock_isvc
-            mock_client.get_inference_service_events.return_value = []
-            mock_client.get_inference_service_logs.return_value = ""
+        mock_client = mock_server.inference_client
+        mock_client.get_inference_service.return_value = mock_isvc
+        mock_client.get_inference_service_events.return_value = []
+        mock_client.get_inference_service_logs.return_value = ""
 
-            result = _diagnose_model(mock_server, "my-model", "test-ns")
+        result = _diagnose_model(mock_server, "my-model", "test-ns")
 
         assert "Model not ready: Failed" in result["issues_detected"]
 
@@ -78,21 +72,18 @@ class TestDiagnoseModel:
         mock_isvc.url = None
         mock_isvc.storage_uri = None
 
-        with patch(
-            "rhoai_mcp.domains.inference.client.InferenceClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_inference_service.return_value = mock_isvc
-            mock_client.get_inference_service_events.return_value = [
-                {
-                    "type": "Warning",
-                    "reason": "Failed",
-                    "message": "ImagePullBackOff: unable to pull image",
-                }
-            ]
-            mock_client.get_inference_service_logs.return_value = ""
-
-            result = _diagnose_model(mock_server, "my-model", "test-ns")
+        mock_client = mock_server.inference_client
+        mock_client.get_inference_service.return_value = mock_isvc
+        mock_client.get_inference_service_events.return_value = [
+            {
+                "type": "Warning",
+                "reason": "Failed",
+                "message": "ImagePullBackOff: unable to pull image",
+            }
+        ]
+        mock_client.get_inference_service_logs.return_value = ""
+
+        result = _diagnose_model(mock_server, "my-model", "test-ns")
 
         assert "Image pull failure" in result["issues_detected"]
         assert any("image name" in fix for fix in result["suggested_fixes"])
@@ -106,21 +97,18 @@ class TestDiagnoseModel:
         mock_isvc.url = None
         mock_isvc.storage_uri = None
 
-        with patch(
-            "rhoai_mcp.domains.inference.client.InferenceClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_inference_service.return_value = mock_isvc
-            mock_client.get_inference_service_events.return_value = [
-                {
-                    "type": "Warning",
-                    "reason": "FailedScheduling",
-                    "message": "Insufficient nvidia.com/gpu",
-                }
-            ]
-            mock_client.get_inference_service_logs.return_value = ""
-
-            result = _diagnose_model(mock_server, "my-model", "test-ns")
+        mock_client = mock_server.inference_client
+        mock_client.get_inference_service.return_value = mock_isvc
+        mock_client.get_inference_service_events.return_value = [
+            {
+                "type": "Warning",
+                "reason": "FailedScheduling",
+                "message": "Insufficient nvidia.com/gpu",
+            }
+        ]
+        mock_client.get_inference_service_logs.return_value = ""
+
+        result = _diagnose_model(mock_server, "my-model", "test-ns")
 
         assert "Pod scheduling failed" in result["issues_detected"]
         assert any("GPU" in fix for fix in result["suggested_fixes"])
@@ -134,21 +122,18 @@ class TestDiagnoseModel:
         mock_isvc.url = None
         mock_isvc.storage_uri = None
 
-        with patch(
-            "rhoai_mcp.domains.inference.client.InferenceClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_inference_service.return_value = mock_isvc
-            mock_client.get_inference_service_events.return_value = [
-                {
-                    "type": "Warning",
-                    "reason": "BackOff",
-                    "message": "Back-off restarting failed container (CrashLoopBackOff)",
-                }
-            ]
-            mock_client.get_inference_service_logs.return_value = ""
-
-            result = _diagnose_model(mock_server, "my-model", "test-ns")
+        mock_client = mock_server.inference_client
+        mock_client.get_inference_service.return_value = mock_isvc
+        mock_client.get_inference_service_events.return_value = [
+            {
+                "type": "Warning",
+                "reason": "BackOff",
+                "message": "Back-off restarting failed container (CrashLoopBackOff)",
+            }
+        ]
+        mock_client.get_inference_service_logs.return_value = ""
+
+        result = _diagnose_model(mock_server, "my-model", "test-ns")
 
         assert "Container crash loop" in result["issues_detected"]
 
@@ -161,34 +146,28 @@ class TestDiagnoseModel:
         mock_isvc.url = None
         mock_isvc.storage_uri = None
 
-        with patch(
-            "rhoai_mcp.domains.inference.client.InferenceClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_inference_service.return_value = mock_isvc
-            mock_client.get_inference_service_events.return_value = [
-                {
-                    "type": "Warning",
-                    "reason": "OOMKilled",
-                    "message": "Container killed due to OOM",
-                }
-            ]
-            mock_client.get_inference_service_logs.return_value = ""
-
-            result = _diagnose_model(mock_server, "my-model", "test-ns")
+        mock_client = mock_server.inference_client
+        mock_client.get_inference_service.return_value = mock_isvc
+        mock_client.get_inference_service_events.return_value = [
+            {
+                "type": "Warning",
+                "reason": "OOMKilled",
+                "message": "Container killed due to OOM",
+            }
+        ]
+        mock_client.get_inference_service_logs.return_value = ""
+
+        result = _diagnose_model(mock_server, "my-model", "test-ns")
 
         assert "Out of memory" in result["issues_detected"]
         assert any("memory" in fix for fix in result["suggested_fixes"])
 
     def test_diagnose_model_exception(self, mock_server: MagicMock) -> None:
         """Test diagnosing a model when the client throws."""
-        with patch(
-            "rhoai_mcp.domains.inference.client.InferenceClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_inference_service.side_effect = Exception("not found")
+        mock_client = mock_server.inference_client
+        mock_client.get_inference_service.side_effect = Exception("not found")
 
-            result = _diagnose_model(mock_server, "my-model", "test-ns")
+        result = _diagnose_model(mock_server, "my-model", "test-ns")
 
         assert any("Failed to get model" in i for i in result["issues_detected"])
 
@@ -213,17 +192,14 @@ class TestDiagnoseWorkbench:
         mock_wb.url = "https://my-wb.example.com"
         mock_wb.volumes = ["my-wb-pvc", "shared-data"]
 
-        with patch(
-            "rhoai_mcp.domains.notebooks.client.NotebookClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_workbench.return_value = mock_wb
-            mock_client.get_workbench_events.return_value = [
-                {"type": "Normal", "reason": "Started", "message": "Started"}
-            ]
-            mock_client.get_workbench_logs.return_value = "Jupyter running"
+        mock_client = mock_server.notebook_client
+        mock_client.get_workbench.return_value = mock_wb
+        mock_client.get_workbench_events.return_value = [
+            {"type": "Normal", "reason": "Started", "message": "Started"}
+        ]
+        mock_client.get_workbench_logs.return_value = "Jupyter running"
 
-            result = _diagnose_workbench(mock_server, "my-wb", "test-ns")
+        result = _diagnose_workbench(mock_server, "my-wb", "test-ns")
 
         assert result["resource"]["name"] == "my-wb"
         assert result["resource"]["status"] == "Running"
@@ -242,14 +218,11 @@ class TestDiagnoseWorkbench:
         mock_wb.url = "https://my-wb.example.com"
         mock_wb.volumes = []
 
-        with patch(
-            "rhoai_mcp.domains.notebooks.client.NotebookClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_workbench.return_value = mock_wb
-            mock_client.get_workbench_events.return_value = []
+        mock_client = mock_server.notebook_client
+        mock_client.get_workbench.return_value = mock_wb
+        mock_client.get_workbench_events.return_value = []
 
-            result = _diagnose_workbench(mock_server, "my-wb", "test-ns")
+        result = _diagnose_workbench(mock_server, "my-wb", "test-ns")
 
         assert "Workbench is stopped" in result["issues_detected"]
         assert result["logs"] is None
@@ -269,21 +242,18 @@ class TestDiagnoseWorkbench:
         mock_wb.url = None
         mock_wb.volumes = ["my-wb-pvc"]
 
-        with patch(
-            "rhoai_mcp.domains.notebooks.client.NotebookClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_workbench.return_value = mock_wb
-            mock_client.get_workbench_events.return_value = [
-                {
-                    "type": "Warning",
-                    "reason": "ErrImagePull",
-                    "message": "rpc error: image not found",
-                }
-            ]
-            mock_client.get_workbench_logs.return_value = ""
-
-            result = _diagnose_workbench(mock_server, "my-wb", "test-ns")
+        mock_client = mock_server.notebook_client
+        mock_client.get_workbench.return_value = mock_wb
+        mock_client.get_workbench_events.return_value = [
+            {
+                "type": "Warning",
+                "reason": "ErrImagePull",
+                "message": "rpc error: image not found",
+            }
+        ]
+        mock_client.get_workbench_logs.return_value = ""
+
+        result = _diagnose_workbench(mock_server, "my-wb", "test-ns")
 
         assert "Image pull failure" in result["issues_detected"]
         assert any("image name" in fix for fix in result["suggested_fixes"])
@@ -299,15 +269,12 @@ class TestDiagnoseWorkbench:
         mock_wb.url = None
         mock_wb.volumes = []
 
-        with patch(
-            "rhoai_mcp.domains.notebooks.client.NotebookClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_workbench.return_value = mock_wb
-            mock_client.get_workbench_events.return_value = []
-            mock_client.get_workbench_logs.return_value = ""
+        mock_client = mock_server.notebook_client
+        mock_client.get_workbench.return_value = mock_wb
+        mock_client.get_workbench_events.return_value = []
+        mock_client.get_workbench_logs.return_value = ""
 
-            result = _diagnose_workbench(mock_server, "my-wb", "test-ns")
+        result = _diagnose_workbench(mock_server, "my-wb", "test-ns")
 
         assert "Workbench is in error state" in result["issues_detected"]
         assert any("events and logs" in fix for fix in result["suggested_fixes"])
@@ -323,32 +290,26 @@ class TestDiagnoseWorkbench:
         mock_wb.url = None
         mock_wb.volumes = ["my-wb-pvc"]
 
-        with patch(
-            "rhoai_mcp.domains.notebooks.client.NotebookClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_workbench.return_value = mock_wb
-            mock_client.get_workbench_events.return_value = [
-                {
-                    "type": "Warning",
-                    "reason": "FailedScheduling",
-                    "message": "0/6 nodes are available: Insufficient cpu",
-                }
-            ]
-            mock_client.get_workbench_logs.return_value = ""
-
-            result = _diagnose_workbench(mock_server, "my-wb", "test-ns")
+        mock_client = mock_server.notebook_client
+        mock_client.get_workbench.return_value = mock_wb
+        mock_client.get_workbench_events.return_value = [
+            {
+                "type": "Warning",
+                "reason": "FailedScheduling",
+                "message": "0/6 nodes are available: Insufficient cpu",
+            }
+        ]
+        mock_client.get_workbench_logs.return_value = ""
+
+        result = _diagnose_workbench(mock_server, "my-wb", "test-ns")
 
         assert "Pod scheduling failed" in result["issues_detected"]
 
     def test_diagnose_workbench_exception(self, mock_server: MagicMock) -> None:
         """Test diagnosing a workbench when the client throws."""
-        with patch(
-            "rhoai_mcp.domains.notebooks.client.NotebookClient"
-        ) as mock_cls:
-            mock_client = mock_cls.return_value
-            mock_client.get_workbench.side_effect = Exception("not found")
+        mock_client = mock_server.notebook_client
+        mock_client.get_workbench.side_effect = Exception("not found")
 
-            result = _diagnose_workbench(mock_server, "my-wb", "test-ns")
+        result = _diagnose_workbench(mock_server, "my-wb", "test-ns")
 
         assert any("Failed to get workbench" in i for i in result["issues_detected"])
@@ -8,6 +8,9 @@ from rhoai_mcp.composites.meta.tools import (
     DISCOVERY_PATTERN,
     INTENT_PATTERNS,
     TOOL_CATEGORIES,
+    _example_args,
+    _match_intent,
+    _score_intent,
     register_tools,
 )
 
@@ -74,6 +77,99 @@ class TestIntentPatterns:
             assert "explanation" in pattern
 
 
+class TestMatchIntent:
+    """Tests for intent keyword matching."""
+
+    def test_most_keyword_hits_wins(self) -> None:
+        """Pattern with the most keyword hits is selected."""
+        result = _match_intent("check the pvc volume for my training s3 data")
+        assert result["category"] == "storage"
+
+    def test_tie_goes_to_first_pattern(self) -> None:
+        """Ties resolve to the pattern defined first."""
+        result = _match_intent("train then deploy")
+        assert result["category"] == "training"
+
+    def test_matching_is_case_insensitive(self) -> None:
+        """Keywords match regardless of intent casing."""
+        result = _match_intent("DEBUG My Job")
+        assert result["category"] == "diagnostics"
+
+    @pytest.mark.parametrize(
+        ("intent", "category"),
+        [
+            ("serving a model", "inference"),
+            ("finetuning llama", "training"),
+            ("exploring pvc usage", "discovery"),
+            ("debugging a job", "diagnostics"),
+        ],
+    )
+    def test_inflected_keywords_match(self, intent: str, category: str) -> None:
+        """Common inflections of intent keywords still match."""
+        assert _match_intent(intent)["category"] == category
+
+    @pytest.mark.parametrize(
+        ("intent", "category"),
+        [
+            ("retrain the model", "training"),
+            ("list my pvcs", "storage"),
+            ("open jupyter-lab", "workbenches"),
+        ],
+    )
+    def test_keywords_match_inside_words(self, intent: str, category: str) -> None:
+        """Keywords match as substrings, not only as whole tokens."""
+        assert _match_intent(intent)["category"] == category
+
+    def test_no_hits_returns_discovery(self) -> None:
+        """No keyword hits falls back to the discovery pattern."""
+        assert _match_intent("hello") is DISCOVERY_PATTERN
+
+
+class TestScoreIntent:
+    """Tests for per-pattern intent scoring."""
+
+    def test_scores_every_pattern(self) -> None:
+        """Scores are returned for each pattern in definition order."""
+        scores = _score_intent("train then deploy to serve predictions")
+        by_category = {p["category"]: s for p, s in zip(INTENT_PATTERNS, scores, strict=True)}
+
+        assert by_category["training"] == 1
+        assert by_category["inference"] == 3
+        assert by_category["storage"] == 0
+
+    def test_keyword_counted_once(self) -> None:
+        """Repeated keywords only count once."""
+        scores = _score_intent("train train train")
+        assert max(scores) == 1
+
+
+class TestExampleArgs:
+    """Tests for example call argument building."""
+
+    def test_known_tool_uses_template(self) -> None:
+        """Tools with a template get their full example arguments."""
+        args = _example_args("prepare_training", "ns", "res")
+        assert args["namespace"] == "ns"
+        assert args["model_id"] == "meta-llama/Llama-2-7b-hf"
+
+    def test_resource_name_is_used(self) -> None:
+        """diagnose_resource examples use the resource name from context."""
+        args = _example_args("diagnose_resource", "ns", "my-job")
+        assert args == {"resource_type": "training_job", "name": "my-job", "namespace": "ns"}
+
+    def test_tool_without_args(self) -> None:
+        """explore_cluster example takes no arguments."""
+        assert _example_args("explore_cluster", "ns", "res") == {}
+
+    def test_unknown_tool_gets_namespace(self) -> None:
+        """Tools without a template get a namespace-only example."""
+        assert _example_args("list_storage", "ns", "res") == {"namespace": "ns"}
+
+    def test_templates_return_fresh_dicts(self) -> None:
+        """Each call returns a new dict so callers cannot share state."""
+        assert _example_args("train", "ns", "res") is not _example_args("train", "ns", "res")
+
+
 class TestSuggestTools:
     """Tests for suggest_tools function."""
 
@@ -145,6 +241,15 @@ class TestSuggestTools:
         assert result["category"] == "discovery"
         assert "explore_cluster" in result["workflow"]
 
+    def test_all_categories_listed(self, mock_mcp: MagicMock, mock_server: MagicMock) -> None:
+        """Every category name is returned with a suggestion."""
+        register_tools(mock_mcp, mock_server)
+        suggest_tools = mock_mcp._registered_tools["suggest_tools"]
+
+        result = suggest_tools("train a model", None)
+
+        assert result["all_categories"] == list(TOOL_CATEGORIES)
+
 
 class TestListToolCategories:
     """Tests for list_tool_categories function."""
@@ -172,3 +277,32 @@ class TestListToolCategories:
         result = list_categories()
 
         assert "recommendation" in result
+
+    def test_key_tools_and_use_first(self, mock_mcp: MagicMock, mock_server: MagicMock) -> None:
+        """Each category lists its first three tools and use_first flag."""
+        register_tools(mock_mcp, mock_server)
+        list_categories = mock_mcp._registered_tools["list_tool_categories"]
+
+        result = list_categories()
+        by_name = {c["category"]: c for c in result["categories"]}
+
+        assert by_name["discovery"]["use_first"] is True
+        assert by_name["training"]["use_first"] is False
+        assert by_name["training"]["key_tools"] == TOOL_CATEGORIES["training"]["tools"][:3]
+
+    def test_result_mutation_not_shared(self, mock_mcp: MagicMock, mock_server: MagicMock) -> None:
+        """Mutating one response does not change later responses."""
+        register_tools(mock_mcp, mock_server)
+        list_categories = mock_mcp._registered_tools["list_tool_categories"]
+
+        first = list_categories()
+        first["categories"][0]["key_tools"].append("extra")
+        first["categories"][0]["description"] = "changed"
+        first["categories"].clear()
+        first["recommendation"] = "changed"
+
+        second = list_categories()
+        assert len(second["categories"]) == len(TOOL_CATEGORIES)
+        assert second["recommendation"] != "changed"
+        assert second["categories"][0]["description"] != "changed"
+        assert "extra" not in second["categories"][0]["key_tools"]
@@ -0,0 +1,230 @@
+"""Tests for training planning tools and helpers."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rhoai_mcp.composites.training.planning import (
+    _base_memory_gb,
+    _extract_param_count,
+    _sanitize_pvc_name,
+    register_tools,
+)
+from rhoai_mcp.utils.errors import NotFoundError
+
+
+@pytest.fixture
+def mock_mcp() -> MagicMock:
+    """Create a mock FastMCP server that captures tool registrations."""
+    mock = MagicMock()
+    registered_tools: dict = {}
+
+    def capture_tool():
+        def decorator(f):
+            registered_tools[f.__name__] = f
+            return f
+
+        return decorator
+
+    mock.tool = capture_tool
+    mock._registered_tools = registered_tools
+    return mock
+
+
+@pytest.fixture
+def mock_server() -> MagicMock:
+    """Create a mock RHOAIServer whose checkpoint PVC is already bound."""
+    server = MagicMock()
+    server.config.is_operation_allowed.return_value = (True, None)
+    server.k8s.get_pvc.return_value.status.phase = "Bound"
+    return server
+
+
+@pytest.fixture
+def mock_training_client() -> MagicMock:
+    """Create a mock TrainingClient for a cluster with GPUs and one runtime."""
+    client = MagicMock()
+    client.get_cluster_resources.return_value.has_gpus = True
+    client.get_cluster_resources.return_value.gpu_info.available = 4
+    runtime = MagicMock()
+    runtime.name = "torch-distributed"
+    client.list_cluster_training_runtimes.return_value = [runtime]
+    return client
+
+
+class TestPrepareTraining:
+    """Tests for the prepare_training composite tool."""
+
+    def _prepare(
+        self, mock_mcp: MagicMock, mock_server: MagicMock, client: MagicMock, **kwargs
+    ) -> dict:
+        register_tools(mock_mcp, mock_server)
+        prepare_training = mock_mcp._registered_tools["prepare_training"]
+        with patch("rhoai_mcp.composites.training.planning.TrainingClient", return_value=client):
+            return prepare_training(
+                namespace="ns",
+                model_id="meta-llama/Llama-2-7b-hf",
+                dataset_id="tatsu-lab/alpaca",
+                **kwargs,
+            )
+
+    def test_ready_with_auto_selected_runtime(
+        self,
+        mock_mcp: MagicMock,
+        mock_server: MagicMock,
+        mock_training_client: MagicMock,
+    ) -> None:
+        """All checks pass and the first runtime is recommended."""
+        result = self._prepare(mock_mcp, mock_server, mock_training_client)
+
+        assert result["ready"] is True
+        assert result["issues"] is None
+        assert result["recommended_runtime"] == "torch-distributed"
+        assert result["storage_pvc"] == "training-checkpoints-ns"
+        mock_server.k8s.get.assert_not_called()
+
+    def test_missing_runtime_reported(
+        self,
+        mock_mcp: MagicMock,
+        mock_server: MagicMock,
+        mock_training_client: MagicMock,
+    ) -> None:
+        """A named runtime that does not exist is reported as an issue."""
+        mock_server.k8s.get.side_effect = NotFoundError("ClusterTrainingRuntime", "missing")
+
+        result = self._prepare(mock_mcp, mock_server, mock_training_client, runtime_name="missing")
+
+        assert result["ready"] is False
+        assert "Runtime 'missing' not found" in result["issues"]
+
+    def test_lookup_failures_reported_in_order(
+        self,
+        mock_mcp: MagicMock,
+        mock_server: MagicMock,
+        mock_training_client: MagicMock,
+    ) -> None:
+        """Failures from concurrent lookups are reported in check order."""
+        mock_training_client.get_cluster_resources.side_effect = Exception("boom")
+        mock_training_client.list_cluster_training_runtimes.side_effect = Exception("boom")
+
+        result = self._prepare(mock_mcp, mock_server, mock_training_client)
+
+        assert result["issues"] == [
+            "Failed to check cluster resources: boom",
+            "Failed to list training runtimes",
+        ]
+
+    @pytest.mark.parametrize(
+        ("binds_immediately", "warning"),
+        [(True, None), (False, "will bind on first consumer"), (None, "not bound yet")],
+    )
+    def test_created_storage_not_ready(
+        self,
+        mock_mcp: MagicMock,
+        mock_server: MagicMock,
+        mock_training_client: MagicMock,
+        binds_immediately: bool | None,
+        warning: str | None,
+    ) -> None:
+        """Newly created storage is never treated as Bound; the binding mode shapes the warning."""
+        mock_server.k8s.get_pvc.side_effect = NotFoundError("PersistentVolumeClaim", "pvc")
+
+        with patch(
+            "rhoai_mcp.composites.training.storage.create_training_pvc",
+            return_value={"created": True, "binds_immediately": binds_immediately},
+        ):
+            result = self._prepare(mock_mcp, mock_server, mock_training_client)
+
+        assert result["storage_created"] is True
+        assert result["storage_pvc"] is None
+        assert mock_server.k8s.get_pvc.call_count == 1
+        if warning is None:
+            assert result["warnings"] is None
+        else:
+            assert warning in result["warnings"][0]
+
+
+class TestSanitizePvcName:
+    """Tests for _sanitize_pvc_name."""
+
+    def test_simple_name(self) -> None:
+        """Valid names pass through unchanged."""
+        assert _sanitize_pvc_name("training-checkpoints", "my-project") == (
+            "training-checkpoints-my-project"
+        )
+
+    def test_invalid_characters_replaced(self) -> None:
+        """Uppercase is lowered and invalid characters become hyphens."""
+        assert _sanitize_pvc_name("Training_Checkpoints", "My.Project") == (
+            "training-checkpoints-my-project"
+        )
+
+    def test_non_ascii_characters_replaced(self) -> None:
+        """Non-ASCII letters and digits are not DNS-1123 safe and are replaced."""
+        assert _sanitize_pvc_name("café", "proj٣") == "caf-proj"
+
+    def test_repeated_hyphens_collapsed(self) -> None:
+        """Runs of hyphens collapse and edge hyphens are stripped."""
+        assert _sanitize_pvc_name("--a__b--", "") == "a-b"
+
+    def test_empty_result(self) -> None:
+        """Names with no valid characters fall back to 'pvc'."""
+        assert _sanitize_pvc_name("___") == "pvc"
+
+    def test_long_name_truncated_with_hash(self) -> None:
+        """Names over 63 characters are truncated with a stable hash suffix."""
+        name = _sanitize_pvc_name("training-checkpoints", "x" * 80)
+
+        assert len(name) <= 63
+        assert name == _sanitize_pvc_name("training-checkpoints", "x" * 80)
+        assert name != _sanitize_pvc_name("training-checkpoints", "x" * 81)
+
+
+class TestExtractParamCount:
+    """Tests for _extract_param_count."""
+
+    @pytest.mark.parametrize(
+        ("model_id", "expected"),
+        [
+            ("meta-llama/Llama-2-7b-hf", 7.0),
+            ("Qwen/Qwen2.5-72B-Instruct", 72.0),
+            ("mistralai/mistral-7b", 7.0),
+            ("some/model-1.5b", 1.5),
+            ("google/bert-350m", 0.35),
+            ("org/model-350m-7b", 7.0),
+            ("unknown/model", 7.0),
+        ],
+    )
+    def test_param_count(self, model_id: str, expected: float) -> None:
+        """Parameter counts are parsed from common model ID patterns."""
+        assert _extract_param_count(model_id) == pytest.approx(expected)
+
+    def test_results_are_memoized(self) -> None:
+        """Repeated lookups for the same model ID hit the cache."""
+        _extract_param_count.cache_clear()
+
+        _extract_param_count("meta-llama/Llama-2-13b-hf")
+        _extract_param_count("meta-llama/Llama-2-13b-hf")
+
+        assert _extract_param_count.cache_info().hits == 1
+
+
+class TestBaseMemoryGb:
+    """Tests for _base_memory_gb."""
+
+    @pytest.mark.parametrize(
+        ("param_count", "expected"),
+        [
+            (0.35, 2),
+            (1.0, 6),
+            (7.0, 26),
+            (12.9, 26),
+            (13.0, 48),
+            (70.0, 160),
+            (250.0, 16),
+            (-1.0, 16),
+        ],
+    )
+    def test_bucket_lookup(self, param_count: float, expected: int) -> None:
+        """Model sizes map to their GPU_MEMORY_ESTIMATES bucket, else the default."""
+        assert _base_memory_gb(param_count) == expected
@@ -0,0 +1,191 @@
+"""Tests for training storage helpers."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rhoai_mcp.composites.training import storage
+from rhoai_mcp.composites.training.storage import _find_rwx_storage_class, create_training_pvc
+from rhoai_mcp.utils.errors import NotFoundError, ResourceExistsError
+
+
+@pytest.fixture
+def mock_k8s() -> MagicMock:
+    """Create a mock K8sClient with no existing PVC."""
+    k8s = MagicMock()
+    k8s.get_pvc.side_effect = NotFoundError("PersistentVolumeClaim", "ckpt", "ns")
+    k8s._rwx_sc_cache = None
+    k8s._sc_binding_modes = {}
+    return k8s
+
+
+def _storage_class(mode: str) -> MagicMock:
+    sc = MagicMock()
+    sc.volume_binding_mode = mode
+    return sc
+
+
+class TestCreateTrainingPvc:
+    """Tests for create_training_pvc."""
+
+    def test_invalid_size(self, mock_k8s: MagicMock) -> None:
+        """Sizes below 1 GB are rejected."""
+        result = create_training_pvc(mock_k8s, "ns", "ckpt", size_gb=0)
+
+        assert result["created"] is False
+        assert "error" in result
+
+    def test_existing_pvc_reports_status(self, mock_k8s: MagicMock) -> None:
+        """An existing PVC is reported with its phase and not recreated."""
+        mock_k8s.get_pvc.side_effect = None
+        mock_k8s.get_pvc.return_value.status.phase = "Bound"
+
+        result = create_training_pvc(mock_k8s, "ns", "ckpt", size_gb=10)
+
+        assert result["exists"] is True
+        assert result["status"] == "Bound"
+        mock_k8s.create_pvc.assert_not_called()
+
+    @patch("kubernetes.client.StorageV1Api")
+    def test_immediate_binding(self, mock_storage_api: MagicMock, mock_k8s: MagicMock) -> None:
+        """PVCs on Immediate storage classes are hinted to bind without a consumer."""
+        mock_storage_api.return_value.read_storage_class.return_value = _storage_class("Immediate")
+
+        result = create_training_pvc(mock_k8s, "ns", "ckpt", size_gb=10, storage_class="nfs")
+
+        assert result["created"] is True
+        assert result["binds_immediately"] is True
+
+    @patch("kubernetes.client.StorageV1Api")
+    def test_wait_for_first_consumer(
+        self, mock_storage_api: MagicMock, mock_k8s: MagicMock
+    ) -> None:
+        """PVCs on WaitForFirstConsumer storage classes wait for a consuming pod."""
+        mock_storage_api.return_value.read_storage_class.return_value = _storage_class(
+            "WaitForFirstConsumer"
+        )
+
+        result = create_training_pvc(mock_k8s, "ns", "ckpt", size_gb=10, storage_class="nfs")
+
+        assert result["binds_immediately"] is False
+
+    @patch("kubernetes.client.StorageV1Api")
+    def test_default_storage_class_from_created_pvc(
+        self, mock_storage_api: MagicMock, mock_k8s: MagicMock
+    ) -> None:
+        """The storage class assigned by the API server is used when none was given."""
+        mock_k8s.create_pvc.return_value.spec.storage_class_name = "gp3"
+        mock_storage_api.return_value.read_storage_class.return_value = _storage_class("Immediate")
+
+        result = create_training_pvc(
+            mock_k8s, "ns", "ckpt", size_gb=10, access_mode="ReadWriteOnce"
+        )
+
+        assert result["storage_class"] == "gp3"
+        mock_storage_api.return_value.read_storage_class.assert_called_once_with("gp3")
+
+    @patch("kubernetes.client.StorageV1Api")
+    def test_binding_mode_read_once_per_storage_class(
+        self, mock_storage_api: MagicMock, mock_k8s: MagicMock
+    ) -> None:
+        """Storage class binding modes are cached across PVC creations."""
+        mock_storage_api.return_value.read_storage_class.return_value = _storage_class("Immediate")
+
+        create_training_pvc(mock_k8s, "ns", "a", size_gb=10, storage_class="nfs")
+        create_training_pvc(mock_k8s, "ns", "b", size_gb=10, storage_class="nfs")
+
+        mock_storage_api.return_value.read_storage_class.assert_called_once_with("nfs")
+
+    @patch("kubernetes.client.StorageV1Api")
+    def test_binding_mode_lookup_failure_ignored(
+        self, mock_storage_api: MagicMock, mock_k8s: MagicMock
+    ) -> None:
+        """A failed storage class lookup does not turn a created PVC into an error."""
+        mock_storage_api.return_value.read_storage_class.side_effect = ConnectionError("reset")
+
+        result = create_training_pvc(mock_k8s, "ns", "ckpt", size_gb=10, storage_class="nfs")
+
+        assert result["created"] is True
+        assert result["binds_immediately"] is None
+        assert mock_k8s._sc_binding_modes == {}
+
+    def test_create_race_reports_status(self, mock_k8s: MagicMock) -> None:
+        """A PVC created concurrently is reported with its current phase."""
+        pvc = MagicMock()
+        pvc.status.phase = "Pending"
+        mock_k8s.get_pvc.side_effect = [NotFoundError("PersistentVolumeClaim", "ckpt", "ns"), pvc]
+        mock_k8s.create_pvc.side_effect = ResourceExistsError("PersistentVolumeClaim", "ckpt")
+
+        result = create_training_pvc(
+            mock_k8s, "ns", "ckpt", size_gb=10, access_mode="ReadWriteOnce"
+        )
+
+        assert result["exists"] is True
+        assert result["status"] == "Pending"
+
+
+def _storage_class_list(*names: str) -> MagicMock:
+    items = []
+    for name in names:
+        sc = MagicMock()
+        sc.metadata.name = name
+        items.append(sc)
+    return MagicMock(items=items)
+
+
+class TestFindRwxStorageClass:
+    """Tests for _find_rwx_storage_class."""
+
+    @patch("kubernetes.client.StorageV1Api")
+    def test_prefers_known_rwx_class(
+        self, mock_storage_api: MagicMock, mock_k8s: MagicMock
+    ) -> None:
+        """A well-known RWX storage class is preferred over the first listed."""
+        mock_storage_api.return_value.list_storage_class.return_value = _storage_class_list(
+            "gp3", "NFS-Client"
+        )
+
+        assert _find_rwx_storage_class(mock_k8s) == "NFS-Client"
+
+    @patch("kubernetes.client.StorageV1Api")
+    def test_falls_back_to_first_class(
+        self, mock_storage_api: MagicMock, mock_k8s: MagicMock
+    ) -> None:
+        """The first storage class is used when no known RWX class exists."""
+        mock_storage_api.return_value.list_storage_class.return_value = _storage_class_list(
+            "gp3", "standard"
+        )
+
+        assert _find_rwx_storage_class(mock_k8s) == "gp3"
+
+    @patch("kubernetes.client.StorageV1Api")
+    def test_result_cached_on_client(
+        self, mock_storage_api: MagicMock, mock_k8s: MagicMock
+    ) -> None:
+        """Storage classes are listed once within the cache TTL."""
+        mock_storage_api.return_value.list_storage_class.return_value = _storage_class_list("nfs")
+
+        assert _find_rwx_storage_class(mock_k8s) == "nfs"
+        assert _find_rwx_storage_class(mock_k8s) == "nfs"
+
+        mock_storage_api.return_value.list_storage_class.assert_called_once()
+
+    @patch("kubernetes.client.StorageV1Api")
+    def test_expired_cache_relists(self, mock_storage_api: MagicMock, mock_k8s: MagicMock) -> None:
+        """An expired cache entry triggers a fresh listing."""
+        mock_storage_api.return_value.list_storage_class.return_value = _storage_class_list("nfs")
+        mock_k8s._rwx_sc_cache = (time.monotonic() - storage._RWX_SC_CACHE_TTL_SECONDS - 1, "old")
+
+        assert _find_rwx_storage_class(mock_k8s) == "nfs"
+        mock_storage_api.return_value.list_storage_class.assert_called_once()
+
+    @patch("kubernetes.client.StorageV1Api")
+    def test_api_error_not_cached(self, mock_storage_api: MagicMock, mock_k8s: MagicMock) -> None:
+        """Listing failures are not cached."""
+        from kubernetes.client import ApiException
+
+        mock_storage_api.return_value.list_storage_class.side_effect = ApiException(status=403)
+
+        assert _find_rwx_storage_class(mock_k8s) is None
+        assert mock_k8s._rwx_sc_cache is None
@@ -0,0 +1,94 @@
+"""Tests for data connection MCP tools."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from rhoai_mcp.domains.connections.tools import register_tools
+
+
+@pytest.fixture
+def mock_mcp() -> MagicMock:
+    """Create a mock FastMCP server that captures tool registrations."""
+    mock = MagicMock()
+    registered_tools: dict = {}
+
+    def capture_tool():
+        def decorator(f):
+            registered_tools[f.__name__] = f
+            return f
+
+        return decorator
+
+    mock.tool = capture_tool
+    mock._registered_tools = registered_tools
+    return mock
+
+
+@pytest.fixture
+def mock_server() -> MagicMock:
+    """Create a mock RHOAIServer that allows all operations."""
+    server = MagicMock()
+    server.config.is_operation_allowed.return_value = (True, None)
+    return server
+
+
+class TestConnectionTools:
+    """Tests for the data connection tools."""
+
+    async def test_client_calls_run_off_event_loop(
+        self, mock_mcp: MagicMock, mock_server: MagicMock
+    ) -> None:
+        """Blocking client calls run in a worker thread."""
+        caller_threads: list[threading.Thread] = []
+        client = mock_server.connection_client
+        client.delete_data_connection.side_effect = lambda *_: caller_threads.append(
+            threading.current_thread()
+        )
+        register_tools(mock_mcp, mock_server)
+
+        result = await mock_mcp._registered_tools["delete_data_connection"](
+            name="conn", namespace="ns", confirm=True
+        )
+
+        assert result["deleted"] is True
+        assert caller_threads
+        assert caller_threads[0] is not threading.main_thread()
+
+    async def test_create_passes_request(self, mock_mcp: MagicMock, mock_server: MagicMock) -> None:
+        """The create tool forwards the request and reports the new connection."""
+        client = mock_server.connection_client
+        client.create_s3_data_connection.return_value.aws_s3_bucket = "bucket"
+        register_tools(mock_mcp, mock_server)
+
+        result = await mock_mcp._registered_tools["create_s3_data_connection"](
+            name="conn",
+            namespace="ns",
+            aws_access_key_id="key",
+            aws_secret_access_key="secret",
+            aws_s3_endpoint="https://s3.example.com",
+            aws_s3_bucket="bucket",
+        )
+
+        request = client.create_s3_data_connection.call_args.args[0]
+        assert request.name == "conn"
+        assert request.aws_default_region == "us-east-1"
+        assert result["bucket"] == "bucket"
+
+    async def test_create_denied(self, mock_mcp: MagicMock, mock_server: MagicMock) -> None:
+        """Disallowed operations return an error without calling the client."""
+        mock_server.config.is_operation_allowed.return_value = (False, "read-only")
+        register_tools(mock_mcp, mock_server)
+
+        result = await mock_mcp._registered_tools["create_s3_data_connection"](
+            name="conn",
+            namespace="ns",
+            aws_access_key_id="key",
+            aws_secret_access_key="secret",
+            aws_s3_endpoint="https://s3.example.com",
+            aws_s3_bucket="bucket",
+        )
+
+        assert result == {"error": "read-only"}
+        mock_server.connection_client.create_s3_data_connection.assert_not_called()
@@ -1,11 +1,14 @@
 """Tests for InferenceClient pod diagnostic methods."""
 
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
+from rhoai_mcp.clients.base import ResourcePage
 from rhoai_mcp.domains.inference.client import InferenceClient
+from rhoai_mcp.utils.errors import RHOAIError
 
 
 class TestInferenceClientDiagnostics:
@@ -249,3 +252,69 @@ class TestInferenceClientDiagnostics:
         mock_pod.status.conditions = None
 
         assert client._is_pod_ready(mock_pod) is False
+
+
+def _isvc(name: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        metadata=SimpleNamespace(
+            name=name,
+            namespace="ns",
+            uid=f"uid-{name}",
+            labels={},
+            annotations={},
+            creation_timestamp=None,
+        ),
+        spec={},
+        status=None,
+    )
+
+
+class TestListInferenceServices:
+    """Test InferenceClient.list_inference_services."""
+
+    def test_items_converted_from_chunked_listing(self) -> None:
+        """Later chunks are read through the iterator from the first page's token."""
+        mock_k8s = MagicMock()
+        mock_k8s.list_resources_page.return_value = ResourcePage(
+            items=[_isvc("a")], continue_token="t1", remaining_item_count=1
+        )
+        mock_k8s.iter_resources.return_value = iter([_isvc("b")])
+
+        results = InferenceClient(mock_k8s).list_inference_services("ns")
+
+        assert [r["name"] for r in results] == ["a", "b"]
+        assert mock_k8s.iter_resources.call_args.kwargs["continue_token"] == "t1"
+        mock_k8s.list_resources.assert_not_called()
+
+    def test_listing_failure_returns_empty(self) -> None:
+        """Errors listing the first chunk fall back to an empty list."""
+        mock_k8s = MagicMock()
+        mock_k8s.list_resources_page.side_effect = Exception("forbidden")
+
+        assert InferenceClient(mock_k8s).list_inference_services("ns") == []
+
+    def test_later_chunk_failure_raises(self) -> None:
+        """A failure after the first chunk is not reported as an empty namespace."""
+        mock_k8s = MagicMock()
+        mock_k8s.list_resources_page.return_value = ResourcePage(
+            items=[_isvc("a")], continue_token="t1", remaining_item_count=None
+        )
+        mock_k8s.iter_resources.side_effect = RHOAIError("continue token expired")
+
+        with pytest.raises(RHOAIError, match="expired"):
+            InferenceClient(mock_k8s).list_inference_services("ns")
+
+    def test_first_page_failure_returns_empty(self) -> None:
+        """A failed first page is empty, matching list_inference_services."""
+        mock_k8s = MagicMock()
+        mock_k8s.list_resources_page.side_effect = Exception("forbidden")
+
+        assert InferenceClient(mock_k8s).list_inference_services_page("ns", 10) == ([], None, 0)
+
+    def test_continued_page_failure_raises(self) -> None:
+        """Failures while continuing a listing are raised."""
+        mock_k8s = MagicMock()
+        mock_k8s.list_resources_page.side_effect = RHOAIError("continue token expired")
+
+        with pytest.raises(RHOAIError, match="expired"):
+            InferenceClient(mock_k8s).list_inference_services_page("ns", 10, "old")
@@ -0,0 +1,232 @@
+"""Tests for inference MCP tools."""
+
+import time
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rhoai_mcp.domains.inference.tools import register_tools
+from rhoai_mcp.utils.cache import clear_cache
+
+
+@pytest.fixture
+def mock_mcp() -> MagicMock:
+    """Create a mock FastMCP server that captures tool registrations."""
+    mock = MagicMock()
+    registered_tools: dict = {}
+
+    def capture_tool():
+        def decorator(f):
+            registered_tools[f.__name__] = f
+            return f
+
+        return decorator
+
+    mock.tool = capture_tool
+    mock._registered_tools = registered_tools
+    return mock
+
+
+@pytest.fixture
+def mock_server() -> MagicMock:
+    """Create a mock RHOAIServer that allows all operations."""
+    server = MagicMock()
+    server.config.is_operation_allowed.return_value = (True, None)
+    return server
+
+
+@pytest.fixture
+def mock_client(mock_server: MagicMock) -> Iterator[MagicMock]:
+    """Return the server's shared InferenceClient with response caching enabled."""
+    clear_cache()
+    client = mock_server.inference_client
+    client.get_model_endpoint.return_value = {"status": "Ready", "url": "u"}
+    with patch("rhoai_mcp.utils.cache.get_config") as mock_config:
+        mock_config.return_value = MagicMock(enable_response_caching=True, cache_ttl_seconds=30)
+        yield client
+    clear_cache()
+
+
+class TestToolResultCaching:
+    """Tests for cached read-only inference tools."""
+
+    def test_get_model_endpoint_cached(
+        self, mock_mcp: MagicMock, mock_server: MagicMock, mock_client: MagicMock
+    ) -> None:
+        """Repeated endpoint lookups hit the API once."""
+        register_tools(mock_mcp, mock_server)
+        get_model_endpoint = mock_mcp._registered_tools["get_model_endpoint"]
+
+        first = get_model_endpoint(name="m", namespace="ns")
+        second = get_model_endpoint(name="m", namespace="ns")
+
+        assert first == second
+        assert first["message"] == "Model is ready to accept prediction requests"
+        mock_client.get_model_endpoint.assert_called_once_with("m", "ns")
+
+    def test_delete_invalidates_cached_lookups(
+        self, mock_mcp: MagicMock, mock_server: MagicMock, mock_client: MagicMock
+    ) -> None:
+        """Deleting a model drops its cached endpoint."""
+        register_tools(mock_mcp, mock_server)
+        tools = mock_mcp._registered_tools
+
+        tools["get_model_endpoint"](name="m", namespace="ns")
+        tools["get_model_endpoint"](name="other", namespace="ns")
+        tools["delete_inference_service"](name="m", namespace="ns", confirm=True)
+        tools["get_model_endpoint"](name="m", namespace="ns")
+        tools["get_model_endpoint"](name="other", namespace="ns")
+
+        assert mock_client.get_model_endpoint.call_count == 3
+
+    def test_delete_keeps_lookups_in_similar_namespaces(
+        self, mock_mcp: MagicMock, mock_server: MagicMock, mock_client: MagicMock
+    ) -> None:
+        """Invalidation matches the namespace exactly, not as a prefix."""
+        register_tools(mock_mcp, mock_server)
+        tools = mock_mcp._registered_tools
+
+        tools["get_inference_service"](name="m", namespace="ns-dev")
+        tools["get_inference_service"](name="m", namespace="ns", verbosity="minimal")
+        tools["delete_inference_service"](name="m", namespace="ns", confirm=True)
+        tools["get_inference_service"](name="m", namespace="ns-dev")
+        tools["get_inference_service"](name="m", namespace="ns", verbosity="minimal")
+
+        assert mock_client.get_inference_service.call_count == 3
+
+    def test_status_lookups_use_short_ttl(
+        self, mock_mcp: MagicMock, mock_server: MagicMock, mock_client: MagicMock
+    ) -> None:
+        """Polled deployment status expires well before the configured TTL."""
+        register_tools(mock_mcp, mock_server)
+        get_model_endpoint = mock_mcp._registered_tools["get_model_endpoint"]
+
+        get_model_endpoint(name="m", namespace="ns")
+        with patch("rhoai_mcp.utils.cache.time.time", return_value=time.time() + 11):
+            get_model_endpoint(name="m", namespace="ns")
+
+        assert mock_client.get_model_endpoint.call_count == 2
+
+    def test_create_serving_runtime_invalidates_runtime_list(
+        self, mock_mcp: MagicMock, mock_server: MagicMock, mock_client: MagicMock
+    ) -> None:
+        """Instantiating a runtime template refreshes the runtime listing."""
+        mock_client.list_serving_runtimes.return_value = []
+        register_tools(mock_mcp, mock_server)
+        tools = mock_mcp._registered_tools
+
+        tools["list_serving_runtimes"](namespace="ns", include_templates=True)
+        tools["create_serving_runtime"](namespace="ns", template_name="vllm")
+        tools["list_serving_runtimes"](namespace="ns", include_templates=True)
+
+        assert mock_client.list_serving_runtimes.call_count == 2
+
+
+class TestListInferenceServices:
+    """Tests for list_inference_services pagination."""
+
+    @pytest.fixture
+    def tool(self, mock_mcp: MagicMock, mock_server: MagicMock):
+        """Register tools and return list_inference_services."""
+        mock_server.config.max_list_limit = 100
+        mock_server.config.default_list_limit = None
+        register_tools(mock_mcp, mock_server)
+        return mock_mcp._registered_tools["list_inference_services"]
+
+    def test_limit_pages_on_api_server(self, tool, mock_server: MagicMock) -> None:
+        """A limit on the first page is passed to the API server."""
+        client = mock_server.inference_client
+        client.list_inference_services_page.return_value = ([{"name": "a"}], "tok", 4)
+
+        result = tool(namespace="ns", limit=1, verbosity="minimal")
+
+        client.list_inference_services_page.assert_called_once_with(
+            "ns", 1, None, label_selector=None, field_selector=None
+        )
+        client.list_inference_services.assert_not_called()
+        assert result["continue"] == "tok"
+        assert result["total"] == 5
+        assert result["has_more"] is True
+
+    def test_continue_token_fetches_next_page(self, tool, mock_server: MagicMock) -> None:
+        """A continue token fetches the following page."""
+        client = mock_server.inference_client
+        client.list_inference_services_page.return_value = ([{"name": "b"}], None, None)
+
+        result = tool(namespace="ns", limit=1, continue_token="tok")
+
+        client.list_inference_services_page.assert_called_once_with(
+            "ns", 1, "tok", label_selector=None, field_selector=None
+        )
+        assert "continue" not in result
+        assert result["has_more"] is False
+
+    def test_paging_through_three_pages(self, tool, mock_server: MagicMock) -> None:
+        """Only the first page reports an offset and total; later pages do not."""
+        client = mock_server.inference_client
+        client.list_inference_services_page.side_effect = [
+            ([{"name": "a"}, {"name": "b"}], "t1", 3),
+            ([{"name": "c"}, {"name": "d"}], "t2", 1),
+            ([{"name": "e"}], None, None),
+        ]
+
+        first = tool(namespace="ns", limit=2)
+        second = tool(namespace="ns", limit=2, continue_token=first["continue"])
+        third = tool(namespace="ns", limit=2, continue_token=second["continue"])
+
+        assert (first["offset"], first["total"], first["has_more"]) == (0, 5, True)
+        assert (second["offset"], second["total"], second["has_more"]) == (None, None, True)
+        assert (third["offset"], third["total"], third["has_more"]) == (None, None, False)
+        assert second["continue"] == "t2"
+        assert "continue" not in third
+        assert [c.args[2] for c in client.list_inference_services_page.call_args_list] == [
+            None,
+            "t1",
+            "t2",
+        ]
+
+    def test_unknown_remaining_count(self, tool, mock_server: MagicMock) -> None:
+        """The total is unknown when the API server omits remainingItemCount."""
+        client = mock_server.inference_client
+        client.list_inference_services_page.return_value = ([{"name": "a"}], "tok", None)
+
+        result = tool(namespace="ns", limit=1, label_selector="app=x")
+
+        assert result["total"] is None
+        assert result["has_more"] is True
+
+    def test_continue_token_without_limit(self, tool, mock_server: MagicMock) -> None:
+        """A continue token pages at the maximum limit when no limit is given."""
+        client = mock_server.inference_client
+        client.list_inference_services_page.return_value = ([{"name": "b"}], None, None)
+
+        result = tool(namespace="ns", continue_token="tok")
+
+        client.list_inference_services_page.assert_called_once_with(
+            "ns", 100, "tok", label_selector=None, field_selector=None
+        )
+        client.list_inference_services.assert_not_called()
+        assert result["limit"] == 100
+
+    def test_offset_uses_client_side_paging(self, tool, mock_server: MagicMock) -> None:
+        """Offset-based requests keep listing the whole namespace."""
+        client = mock_server.inference_client
+        client.list_inference_services.return_value = [{"name": n} for n in "abc"]
+
+        result = tool(namespace="ns", limit=1, offset=1, verbosity="minimal")
+
+        client.list_inference_services_page.assert_not_called()
+        assert result["total"] == 3
+        assert len(result["items"]) == 1
+
+    def test_selectors_forwarded_without_limit(self, tool, mock_server: MagicMock) -> None:
+        """Selectors are passed through when listing the whole namespace."""
+        client = mock_server.inference_client
+        client.list_inference_services.return_value = []
+
+        tool(namespace="ns", label_selector="app=x")
+
+        client.list_inference_services.assert_called_once_with(
+            "ns", label_selector="app=x", field_selector=None
+        )
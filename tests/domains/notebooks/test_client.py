@@ -4,10 +4,12 @@ from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
+from pydantic import ValidationError
 
 from kubernetes.client.exceptions import ApiException  # type: ignore[import-untyped]
 
 from rhoai_mcp.domains.notebooks.client import NotebookClient
+from rhoai_mcp.domains.notebooks.models import Workbench
 
 
 class TestNotebookClientDiagnostics:
@@ -288,3 +290,56 @@ class TestNotebookClientDiagnostics:
 
         assert result["timestamp"] is None
         assert result["count"] == 1
+
+
+class TestListNotebookImages:
+    """Test NotebookClient.list_notebook_images."""
+
+    def test_images_are_immutable(self) -> None:
+        """Shared standard images cannot be modified by callers."""
+        images = NotebookClient(MagicMock()).list_notebook_images()
+        images.pop()
+
+        with pytest.raises(ValidationError):
+            images[0].recommended = False
+        assert len(NotebookClient(MagicMock()).list_notebook_images()) == 5
+
+
+class TestGetWorkbenchSummary:
+    """Test NotebookClient.get_workbench_summary."""
+
+    @pytest.mark.parametrize(
+        ("annotations", "expected"),
+        [({"kubeflow-resource-stopped": "2024-01-01T00:00:00Z"}, "Stopped"), ({}, "Unknown")],
+    )
+    def test_status_from_annotations(self, annotations: dict, expected: str) -> None:
+        """Status is derived without building the full Workbench model."""
+        notebook = MagicMock(status=None)
+        notebook.metadata.name = "wb"
+        notebook.metadata.namespace = "ns"
+        notebook.metadata.annotations = annotations
+        k8s = MagicMock()
+        k8s.get.return_value = notebook
+
+        summary = NotebookClient(k8s).get_workbench_summary("wb", "ns")
+
+        assert summary["name"] == "wb"
+        assert summary["status"] == expected
+        assert summary["url"]
+
+    def test_summary_from_cr_uses_ready_condition(self) -> None:
+        """Workbench.summary_from_cr reads status from the Ready condition."""
+        notebook = MagicMock()
+        notebook.metadata.name = "wb"
+        notebook.metadata.namespace = "ns"
+        notebook.metadata.annotations = {}
+        notebook.status.conditions = [MagicMock(type="Ready", status="True")]
+
+        summary = Workbench.summary_from_cr(notebook, url="https://wb")
+
+        assert summary == {
+            "name": "wb",
+            "namespace": "ns",
+            "url": "https://wb",
+            "status": "Running",
+        }
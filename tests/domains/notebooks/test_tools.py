@@ -0,0 +1,147 @@
+"""Tests for notebook MCP tools."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from rhoai_mcp.domains.notebooks.tools import register_tools
+
+
+@pytest.fixture
+def mock_mcp() -> MagicMock:
+    """Create a mock FastMCP server that captures tool registrations."""
+    mock = MagicMock()
+    registered_tools: dict = {}
+
+    def capture_tool():
+        def decorator(f):
+            registered_tools[f.__name__] = f
+            return f
+
+        return decorator
+
+    mock.tool = capture_tool
+    mock._registered_tools = registered_tools
+    return mock
+
+
+@pytest.fixture
+def mock_server() -> MagicMock:
+    """Create a mock RHOAIServer that allows all operations."""
+    server = MagicMock()
+    server.config.is_operation_allowed.return_value = (True, None)
+    return server
+
+
+class TestWorkbenchTools:
+    """Tests for the workbench tools."""
+
+    async def test_client_calls_run_off_event_loop(
+        self, mock_mcp: MagicMock, mock_server: MagicMock
+    ) -> None:
+        """Blocking client calls run in a worker thread."""
+        caller_threads: list[threading.Thread] = []
+
+        def get_workbench_summary(*_):
+            caller_threads.append(threading.current_thread())
+            return {"url": "https://wb.example.com", "status": "Running"}
+
+        mock_server.notebook_client.get_workbench_summary.side_effect = get_workbench_summary
+        register_tools(mock_mcp, mock_server)
+
+        result = await mock_mcp._registered_tools["get_workbench_url"](name="wb", namespace="ns")
+
+        assert result["url"] == "https://wb.example.com"
+        assert result["message"] == "Workbench is accessible at the URL"
+        assert caller_threads[0] is not threading.main_thread()
+
+    async def test_stop_denied(self, mock_mcp: MagicMock, mock_server: MagicMock) -> None:
+        """Disallowed operations return an error without calling the client."""
+        mock_server.config.is_operation_allowed.return_value = (False, "read-only")
+        register_tools(mock_mcp, mock_server)
+
+        result = await mock_mcp._registered_tools["stop_workbench"](name="wb", namespace="ns")
+
+        assert result == {"error": "read-only"}
+        mock_server.notebook_client.stop_workbench.assert_not_called()
+
+
+class TestConcurrentReads:
+    """Tests for sharing identical workbench reads that are in flight."""
+
+    @pytest.fixture
+    def tools(self, mock_mcp: MagicMock, mock_server: MagicMock) -> dict:
+        """Register tools with a slow get_workbench."""
+
+        def slow_get(*_):
+            time.sleep(0.05)
+            return MagicMock()
+
+        mock_server.notebook_client.get_workbench.side_effect = slow_get
+        register_tools(mock_mcp, mock_server)
+        return mock_mcp._registered_tools
+
+    async def test_concurrent_calls_share_one_read(
+        self, tools: dict, mock_server: MagicMock
+    ) -> None:
+        """Identical concurrent calls make one API request."""
+        await asyncio.gather(*(tools["get_workbench"](name="wb", namespace="ns") for _ in range(3)))
+
+        mock_server.notebook_client.get_workbench.assert_called_once_with("wb", "ns")
+
+    async def test_different_workbenches_not_shared(
+        self, tools: dict, mock_server: MagicMock
+    ) -> None:
+        """Calls for different workbenches are not coalesced."""
+        await asyncio.gather(
+            tools["get_workbench"](name="a", namespace="ns"),
+            tools["get_workbench"](name="b", namespace="ns"),
+        )
+
+        assert mock_server.notebook_client.get_workbench.call_count == 2
+
+    async def test_later_calls_read_again(self, tools: dict, mock_server: MagicMock) -> None:
+        """Finished reads are not reused by later calls."""
+        await tools["get_workbench"](name="wb", namespace="ns")
+        await tools["get_workbench"](name="wb", namespace="ns")
+
+        assert mock_server.notebook_client.get_workbench.call_count == 2
+
+    async def test_errors_reach_every_caller(self, tools: dict, mock_server: MagicMock) -> None:
+        """A failed shared read raises in each waiting call."""
+        mock_server.notebook_client.get_workbench.side_effect = RuntimeError("boom")
+
+        results = await asyncio.gather(
+            tools["get_workbench"](name="wb", namespace="ns"),
+            tools["get_workbench"](name="wb", namespace="ns"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_failed_read_is_evicted(self, tools: dict, mock_server: MagicMock) -> None:
+        """A failed read is not reused by the next call."""
+        get_workbench = mock_server.notebook_client.get_workbench
+        get_workbench.side_effect = RuntimeError("boom")
+        with pytest.raises(RuntimeError):
+            await tools["get_workbench"](name="wb", namespace="ns")
+
+        get_workbench.side_effect = None
+        await tools["get_workbench"](name="wb", namespace="ns")
+
+        assert get_workbench.call_count == 2
+
+    async def test_different_methods_not_shared(self, tools: dict, mock_server: MagicMock) -> None:
+        """Reads of different client methods with the same arguments are not coalesced."""
+        mock_server.notebook_client.get_workbench_summary.return_value = {"status": "Running"}
+
+        await asyncio.gather(
+            tools["get_workbench"](name="wb", namespace="ns"),
+            tools["get_workbench_url"](name="wb", namespace="ns"),
+        )
+
+        mock_server.notebook_client.get_workbench.assert_called_once_with("wb", "ns")
+        mock_server.notebook_client.get_workbench_summary.assert_called_once_with("wb", "ns")
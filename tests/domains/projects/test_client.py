@@ -0,0 +1,73 @@
+"""Tests for ProjectClient resource summaries."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rhoai_mcp.domains.inference.crds import InferenceCRDs
+from rhoai_mcp.domains.notebooks.crds import NotebookCRDs
+from rhoai_mcp.domains.pipelines.crds import PipelinesCRDs
+from rhoai_mcp.domains.projects.client import ProjectClient
+from rhoai_mcp.utils.annotations import RHOAIAnnotations
+
+
+def _resource(annotations: dict | None = None, conditions: list | None = None) -> MagicMock:
+    resource = MagicMock()
+    resource.metadata.annotations = annotations or {}
+    resource.status.conditions = conditions or []
+    return resource
+
+
+class TestResourceSummary:
+    """Tests for ProjectClient._get_resource_summary."""
+
+    @pytest.fixture
+    def mock_k8s(self) -> MagicMock:
+        """Create a mock K8sClient with one of each resource kind."""
+        k8s = MagicMock()
+        stopped = {RHOAIAnnotations.NOTEBOOK_STOPPED: "2024-01-01T00:00:00Z"}
+        ready = [{"type": "Ready", "status": "True"}]
+        resources = {
+            NotebookCRDs.NOTEBOOK.kind: [_resource(), _resource(stopped)],
+            InferenceCRDs.INFERENCE_SERVICE.kind: [_resource(conditions=ready), _resource()],
+            PipelinesCRDs.DSPA.kind: [_resource()],
+        }
+        k8s.list_resources.side_effect = lambda crd, **_: resources[crd.kind]
+        k8s.list_secrets.return_value = [
+            _resource({RHOAIAnnotations.CONNECTION_TYPE: "s3"}),
+            _resource(),
+        ]
+        k8s.list_pvcs.return_value = [_resource(), _resource(), _resource()]
+        return k8s
+
+    def test_counts_all_resource_kinds(self, mock_k8s: MagicMock) -> None:
+        """Counts are collected from each resource kind."""
+        summary = ProjectClient(mock_k8s)._get_resource_summary("ns")
+
+        assert summary.workbenches == 2
+        assert summary.workbenches_running == 1
+        assert summary.models == 2
+        assert summary.models_ready == 1
+        assert summary.data_connections == 1
+        assert summary.storage == 3
+        assert summary.pipelines == 1
+
+    def test_failed_lookup_counts_as_zero(self, mock_k8s: MagicMock) -> None:
+        """A failing list call only zeroes its own count."""
+        mock_k8s.list_pvcs.side_effect = Exception("forbidden")
+
+        summary = ProjectClient(mock_k8s)._get_resource_summary("ns")
+
+        assert summary.storage == 0
+        assert summary.workbenches == 2
+        assert summary.data_connections == 1
+
+    def test_reuses_shared_executor(self, mock_k8s: MagicMock) -> None:
+        """Summaries for several projects do not create a pool each."""
+        client = ProjectClient(mock_k8s)
+
+        with patch("rhoai_mcp.domains.projects.client.ThreadPoolExecutor") as mock_pool:
+            client._get_resource_summary("ns-a")
+            client._get_resource_summary("ns-b")
+
+        mock_pool.assert_not_called()
@@ -25,6 +25,7 @@ class TestRHOAIConfig:
         assert config.enable_dangerous_operations is False
         assert config.read_only_mode is False
         assert config.log_level == LogLevel.INFO
+        assert config.k8s_connection_pool_maxsize == 32
 
     def test_auth_mode_token_validation(self):
         """Test token auth mode validation."""
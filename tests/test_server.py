@@ -0,0 +1,40 @@
+"""Tests for RHOAIServer."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from rhoai_mcp.domains.connections.client import ConnectionClient
+from rhoai_mcp.domains.inference.client import InferenceClient
+from rhoai_mcp.domains.notebooks.client import NotebookClient
+from rhoai_mcp.server import RHOAIServer
+
+
+class TestDomainClients:
+    """Tests for the shared domain client properties."""
+
+    @pytest.mark.parametrize(
+        ("attr", "client_cls"),
+        [
+            ("notebook_client", NotebookClient),
+            ("inference_client", InferenceClient),
+            ("connection_client", ConnectionClient),
+        ],
+    )
+    def test_client_shared_across_calls(self, attr: str, client_cls: type) -> None:
+        """Each domain client is created once and reused."""
+        server = RHOAIServer()
+        server._k8s_client = Mock()
+
+        client = getattr(server, attr)
+
+        assert isinstance(client, client_cls)
+        assert client._k8s is server._k8s_client
+        assert getattr(server, attr) is client
+
+    def test_client_requires_running_server(self) -> None:
+        """Domain clients are unavailable until the K8s client is connected."""
+        server = RHOAIServer()
+
+        with pytest.raises(RuntimeError, match="Server not running"):
+            _ = server.notebook_client
@@ -11,6 +11,7 @@ from rhoai_mcp.utils.cache import (
     clear_cache,
     clear_expired,
     invalidate,
+    invalidate_call,
     _cache,
 )
 
@@ -120,6 +121,51 @@ class TestCachedDecorator:
             assert result2 == "result-a"
             assert call_count == 2  # Called twice due to expiration
 
+    def test_ttl_override(self) -> None:
+        """Test that a per-function TTL overrides the configured TTL."""
+        call_count = 0
+
+        @cached("test", ttl_seconds=60)
+        def test_func(arg: str) -> str:
+            nonlocal call_count
+            call_count += 1
+            return f"result-{arg}"
+
+        with patch("rhoai_mcp.utils.cache.get_config") as mock_config:
+            mock_config.return_value = MagicMock(
+                enable_response_caching=True,
+                cache_ttl_seconds=1,
+            )
+
+            test_func("a")
+            cached_time, value, ttl = _cache["test:arg=a"]
+            _cache["test:arg=a"] = (cached_time - 30, value, ttl)  # Past config TTL
+            test_func("a")
+
+            assert call_count == 1  # Still within the 60 second override
+
+    def test_positional_and_keyword_calls_share_entry(self) -> None:
+        """Test that the key does not depend on how arguments are passed."""
+        call_count = 0
+
+        @cached("test")
+        def test_func(arg: str, verbosity: str = "full") -> str:
+            nonlocal call_count
+            call_count += 1
+            return f"result-{arg}-{verbosity}"
+
+        with patch("rhoai_mcp.utils.cache.get_config") as mock_config:
+            mock_config.return_value = MagicMock(
+                enable_response_caching=True,
+                cache_ttl_seconds=30,
+            )
+
+            test_func("a")
+            test_func(arg="a")
+            test_func("a", verbosity="full")
+
+            assert call_count == 1
+
     def test_method_caching_per_instance(self) -> None:
         """Test that instance methods cache per-instance."""
         call_count = 0
@@ -156,8 +202,8 @@ class TestCacheManagement:
     def test_clear_cache(self) -> None:
         """Test clearing all cache entries."""
         # Add some entries
-        _cache["key1"] = (time.time(), "value1")
-        _cache["key2"] = (time.time(), "value2")
+        _cache["key1"] = (time.time(), "value1", 30)
+        _cache["key2"] = (time.time(), "value2", 30)
 
         count = clear_cache()
 
@@ -168,26 +214,22 @@ class TestCacheManagement:
         """Test clearing only expired entries."""
         now = time.time()
         # Add expired and non-expired entries
-        _cache["old"] = (now - 100, "old_value")
-        _cache["new"] = (now, "new_value")
+        _cache["old"] = (now - 100, "old_value", 30)
+        _cache["new"] = (now, "new_value", 30)
+        _cache["long_ttl"] = (now - 100, "long_value", 600)
 
-        with patch("rhoai_mcp.utils.cache.get_config") as mock_config:
-            mock_config.return_value = MagicMock(
-                enable_response_caching=True,
-                cache_ttl_seconds=30,
-            )
+        count = clear_expired()
 
-            count = clear_expired()
-
-            assert count == 1
-            assert "old" not in _cache
-            assert "new" in _cache
+        assert count == 1
+        assert "old" not in _cache
+        assert "new" in _cache
+        assert "long_ttl" in _cache
 
     def test_invalidate_pattern(self) -> None:
         """Test invalidating entries by pattern."""
-        _cache["workbenches:ns1"] = (time.time(), [])
-        _cache["workbenches:ns2"] = (time.time(), [])
-        _cache["projects:all"] = (time.time(), [])
+        _cache["workbenches:ns1"] = (time.time(), [], 30)
+        _cache["workbenches:ns2"] = (time.time(), [], 30)
+        _cache["projects:all"] = (time.time(), [], 30)
 
         count = invalidate("workbenches")
 
@@ -196,11 +238,26 @@ class TestCacheManagement:
         assert "workbenches:ns2" not in _cache
         assert "projects:all" in _cache
 
+    def test_invalidate_call(self) -> None:
+        """Test invalidating entries by function arguments."""
+        now = time.time()
+        _cache["get:name=m:namespace=ns:verbosity=full"] = (now, {}, 30)
+        _cache["get:name=m:namespace=ns:verbosity=minimal"] = (now, {}, 30)
+        _cache["get:name=m:namespace=ns-dev:verbosity=full"] = (now, {}, 30)
+        _cache["get_all:name=m:namespace=ns"] = (now, {}, 30)
+
+        count = invalidate_call("get", name="m", namespace="ns")
+
+        assert count == 2
+        assert "get:name=m:namespace=ns-dev:verbosity=full" in _cache
+        assert "get_all:name=m:namespace=ns" in _cache
+
     def test_cache_stats(self) -> None:
         """Test cache statistics."""
         now = time.time()
-        _cache["fresh"] = (now, "value")
-        _cache["stale"] = (now - 100, "old_value")
+        _cache["fresh"] = (now, "value", 30)
+        _cache["stale"] = (now - 100, "old_value", 30)
+        _cache["long_ttl"] = (now - 100, "long_value", 600)
 
         with patch("rhoai_mcp.utils.cache.get_config") as mock_config:
             mock_config.return_value = MagicMock(
@@ -210,8 +267,8 @@ class TestCacheManagement:
 
             stats = cache_stats()
 
-            assert stats["total_entries"] == 2
+            assert stats["total_entries"] == 3
             assert stats["expired_entries"] == 1
-            assert stats["active_entries"] == 1
+            assert stats["active_entries"] == 2
             assert stats["caching_enabled"] is True
             assert stats["ttl_seconds"] == 30
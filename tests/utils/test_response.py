@@ -110,6 +110,23 @@ class TestPaginatedResponse:
         response = PaginatedResponse.build(items, total=3, offset=2, limit=10)
 
         assert response["has_more"] is False
+        assert "continue" not in response
+
+    def test_build_with_continue_token(self) -> None:
+        """Test a continue token is returned and implies more items."""
+        items = [{"name": "a"}]
+        response = PaginatedResponse.build(items, total=1, offset=0, limit=1, continue_token="t")
+
+        assert response["continue"] == "t"
+        assert response["has_more"] is True
+
+    def test_build_with_unknown_total(self) -> None:
+        """Test an unknown total relies on the continue token for has_more."""
+        items = [{"name": "a"}]
+        response = PaginatedResponse.build(items, total=None, offset=0, limit=1)
+
+        assert response["total"] is None
+        assert response["has_more"] is False
 
 
 class TestResponseBuilderWorkbench: